@@ -8,6 +8,7 @@ import pandas as pd
 import plotly.graph_objects as go
 import plotly.express as px
 from plotly.subplots import make_subplots
+from functools import partial
 
 class ScenarioComparator:
     """Handles comparison of multiple scenarios"""
@@ -276,39 +277,42 @@ class ScenarioComparator:
         
         fig = go.Figure()
         
-        for idx, row in df.iterrows():
+        # Column maxima are the same for every scenario
+        max_benefits = df['3-Year Benefits'].max()
+        max_cost = df['3-Year TCO'].max()
+        max_payback = df['Payback (months)'].max()
+        
+        columns = ['Scenario', 'ROI %', '3-Year Benefits', '3-Year TCO', 'Payback (months)']
+        for name, roi, benefits, tco, payback in df[columns].itertuples(index=False, name=None):
             # Normalize values (higher is better for benefits/ROI, lower is better for costs/payback)
             normalized = []
             labels = []
             
             # ROI (higher is better) - scale to 0-100
-            roi_val = min(100, row['ROI %'] / 5)  # 500% ROI = 100 points
+            roi_val = min(100, roi / 5)  # 500% ROI = 100 points
             normalized.append(roi_val)
-            labels.append(f"ROI<br>{row['ROI %']:.0f}%")
+            labels.append(f"ROI<br>{roi:.0f}%")
             
             # Benefits (higher is better) - scale to 0-100
-            max_benefits = df['3-Year Benefits'].max()
-            benefit_val = (row['3-Year Benefits'] / max_benefits * 100) if max_benefits > 0 else 0
+            benefit_val = (benefits / max_benefits * 100) if max_benefits > 0 else 0
             normalized.append(benefit_val)
-            labels.append(f"Benefits<br>${row['3-Year Benefits']/1000:.0f}K")
+            labels.append(f"Benefits<br>${benefits/1000:.0f}K")
             
             # Cost efficiency (lower cost is better) - invert scale
-            max_cost = df['3-Year TCO'].max()
-            cost_val = 100 - (row['3-Year TCO'] / max_cost * 100) if max_cost > 0 else 0
+            cost_val = 100 - (tco / max_cost * 100) if max_cost > 0 else 0
             normalized.append(cost_val)
-            labels.append(f"Cost Efficiency<br>${row['3-Year TCO']/1000:.0f}K")
+            labels.append(f"Cost Efficiency<br>${tco/1000:.0f}K")
             
             # Payback speed (lower is better) - invert scale
-            max_payback = df['Payback (months)'].max()
-            payback_val = 100 - (row['Payback (months)'] / max_payback * 100) if max_payback > 0 else 0
+            payback_val = 100 - (payback / max_payback * 100) if max_payback > 0 else 0
             normalized.append(payback_val)
-            labels.append(f"Payback Speed<br>{row['Payback (months)']:.0f}m")
+            labels.append(f"Payback Speed<br>{payback:.0f}m")
             
             fig.add_trace(go.Scatterpolar(
                 r=normalized,
                 theta=['ROI', 'Benefits', 'Cost Efficiency', 'Payback Speed'],
                 fill='toself',
-                name=row['Scenario'],
+                name=name,
                 hovertext=labels,
                 hoverinfo='text+name'
             ))
@@ -411,11 +415,10 @@ def render_comparison_mode():
         
         st.dataframe(styled_df, use_container_width=True)
         
-        # Export comparison
-        csv = df.to_csv(index=False)
+        # Export comparison - serialized only when the download is clicked
         st.download_button(
             label="📥 Download Comparison (CSV)",
-            data=csv,
+            data=partial(df.to_csv, index=False),
             file_name=f"scenario_comparison_{pd.Timestamp.now().strftime('%Y%m%d_%H%M%S')}.csv",
             mime="text/csv"
         )
@@ -19,9 +19,15 @@ from datetime import datetime
 class ComprehensivePDFGenerator:
     """Generate comprehensive 20+ page PDF reports for Gen AI investments"""
     
+    # Stylesheet shared by every generator - built once per process, read-only during layout
+    _shared_styles = None
+    
     def __init__(self):
-        self.styles = getSampleStyleSheet()
-        self._setup_custom_styles()
+        if ComprehensivePDFGenerator._shared_styles is None:
+            self.styles = getSampleStyleSheet()
+            self._setup_custom_styles()
+            ComprehensivePDFGenerator._shared_styles = self.styles
+        self.styles = ComprehensivePDFGenerator._shared_styles
     
     def _setup_custom_styles(self):
         """Create custom paragraph styles"""
@@ -190,7 +196,7 @@ class ComprehensivePDFGenerator:
         
         return drawing
     
-    def _create_header(self, org_name, industry, use_case):
+    def _create_header(self, org_name, industry, use_case, generated_at):
         """Create report header"""
         elements = []
         
@@ -202,7 +208,7 @@ class ComprehensivePDFGenerator:
         
         meta_text = f"""
         <b>Industry:</b> {industry} | <b>Primary Use Case:</b> {use_case}<br/>
-        <b>Report Generated:</b> {datetime.now().strftime('%B %d, %Y at %I:%M %p')}<br/>
+        <b>Report Generated:</b> {generated_at.strftime('%B %d, %Y at %I:%M %p')}<br/>
         <b>Report Type:</b> Comprehensive TCO & ROI Analysis (20+ Pages)
         """
         meta = Paragraph(meta_text, self.styles['CustomBody'])
@@ -811,9 +817,11 @@ class ComprehensivePDFGenerator:
         
         return elements
     
-    def generate_report(self, cost_data, roi_data=None, risk_data=None):
+    def generate_report(self, cost_data, roi_data=None, risk_data=None, generated_at=None):
         """
         Generate comprehensive 20+ page PDF report
+        
+        generated_at is the time printed on the cover page (defaults to now)
         """
         buffer = io.BytesIO()
         doc = SimpleDocTemplate(
@@ -831,7 +839,8 @@ class ComprehensivePDFGenerator:
         elements.extend(self._create_header(
             cost_data.get('org_name', 'Your Organization'),
             cost_data.get('industry', 'Technology'),
-            cost_data.get('use_case', 'Gen AI Implementation')
+            cost_data.get('use_case', 'Gen AI Implementation'),
+            generated_at or datetime.now()
         ))
         
         # Table of Contents
@@ -872,7 +881,7 @@ class ComprehensivePDFGenerator:
         return pdf
 
 # Wrapper function
-def generate_comprehensive_pdf_report(cost_data, roi_data=None, risk_data=None):
+def generate_comprehensive_pdf_report(cost_data, roi_data=None, risk_data=None, generated_at=None):
     """Generate comprehensive 20+ page PDF report"""
     generator = ComprehensivePDFGenerator()
-    return generator.generate_report(cost_data, roi_data, risk_data)
\ No newline at end of file
+    return generator.generate_report(cost_data, roi_data, risk_data, generated_at)
\ No newline at end of file
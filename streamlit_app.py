@@ -1,9 +1,24 @@
 import streamlit as st
 import pandas as pd
+import numpy as np
 import plotly.graph_objects as go
 import plotly.express as px
 from datetime import datetime
+from functools import partial
+from string import Template
 import json
+import logging
+import sys
+from pathlib import Path
+
+_OUTPUTS_DIR = '/mnt/user-data/outputs'
+if _OUTPUTS_DIR not in sys.path:
+    sys.path.append(_OUTPUTS_DIR)
+
+from ai_model_selector import render_model_comparison_tool
+from comprehensive_pdf_generator import generate_comprehensive_pdf_report
+
+_LOGGER = logging.getLogger(__name__)
 
 # Helper modules temporarily disabled - using built-in functionality
 # from save_load_manager import ScenarioManager, render_save_load_ui, enable_auto_save
@@ -19,33 +34,594 @@ import json
 # from optimization_engine import generate_optimization_recommendations, calculate_optimization_roi
 # from calculator_helpers import DEMO_DATA, DEMO_ROI_DATA, calculate_intelligent_risks
 
-# Demo data - inline for now
-DEMO_DATA = {
-    'org_name': 'TechCorp Solutions',
-    'industry': 'Technology',
-    'use_case': 'Customer Service/Chatbots',
-    'year1_total': 2245993,
-    'year2_total': 2343190,
-    'year3_total': 2514331,
-    'three_year_tco': 7103513,
-    'year1_breakdown': {
-        'API Costs': 78038,
-        'Infrastructure': 60000,
-        'Development': 960000,
-        'Data Management': 280000,
-        'Operations': 350000,
-        'Organizational': 225000,
-        'Contingency': 292956
-    }
+# Organization profile options and their smart-default values (same order, one array per field)
+_INDUSTRIES = ("Financial Services", "Healthcare", "Technology", "Manufacturing", "Retail", "Government", "Other")
+_ORG_SIZES = ("<100", "100-500", "500-1000", "1000-5000", "5000+")
+_MATURITIES = ("Exploring", "Pilot", "Scaling", "Mature")
+_USE_CASES = ("Customer Service/Chatbots", "Content Generation", "Code Assistance", "Data Analysis",
+              "Document Processing", "Knowledge Management", "Multiple Use Cases")
+
+_INDUSTRY_IDX = {name: i for i, name in enumerate(_INDUSTRIES)}
+_SIZE_IDX = {name: i for i, name in enumerate(_ORG_SIZES)}
+_MATURITY_IDX = {name: i for i, name in enumerate(_MATURITIES)}
+_UC_IDX = {name: i for i, name in enumerate(_USE_CASES)}
+
+_IND_COST_PER_M = np.array([18.0, 18.0, 12.0, 12.0, 15.0, 20.0, 15.0], dtype=np.float64)
+_SIZE_DEV = np.array([250000, 450000, 700000, 1200000, 2500000], dtype=np.int64)
+_MAT_INFRA = np.array([1500, 5000, 15000, 50000], dtype=np.int32)
+_UC_REQ = np.array([30, 10, 25, 15, 8, 12, 20], dtype=np.int32)
+_UC_TOKENS = np.array([1800, 4500, 3000, 3500, 5000, 2500, 2500], dtype=np.int32)
+
+# Cost Ranges benchmark tables (rows, columns)
+_IND_ROWS = (("Financial", "1.4x", "SOC2, PCI"),
+             ("Healthcare", "1.5x", "HIPAA"),
+             ("Tech", "1.1x", "Standard"),
+             ("Retail", "1.2x", "PCI"))
+_IND_COLS = ("Industry", "Security Factor", "Requirements")
+
+_MATURITY_ROWS = (("Exploring", "$500-$2K/mo", "$150K-$400K"),
+                  ("Pilot", "$2K-$8K/mo", "$400K-$800K"),
+                  ("Scaling", "$8K-$25K/mo", "$800K-$2M"),
+                  ("Mature", "$25K-$100K/mo", "$2M-$5M"))
+_MATURITY_COLS = ("Stage", "Infrastructure", "Development")
+
+_CASE_ROWS = (("Customer Service", "20-50", "1.5K-2.5K"),
+              ("Content", "5-15", "3K-6K"),
+              ("Code", "15-40", "2K-4K"),
+              ("Documents", "5-20", "4K-8K"))
+_CASE_COLS = ("Use Case", "Req/User/Day", "Tokens")
+
+# Year-over-year growth per cost category: API, embedding, infrastructure (+15%),
+# development (+5%), data (+10%), operations (+8%), organizational (-30%, then -20%).
+# Rows are year 1->2 and year 2->3; the API/embedding columns are set from the
+# user's usage growth rate.
+_GROWTH = np.array([[1.0, 1.0, 1.15, 1.05, 1.1, 1.08, 0.7],
+                    [1.0, 1.0, 1.15, 1.05, 1.1, 1.08, 0.8]], dtype=np.float64)
+_GROWTH.flags.writeable = False
+
+# Year-1 breakdown labels, in cost-category order with contingency last
+_BREAKDOWN_LABELS = ('API Costs', 'Infrastructure', 'Development', 'Data Management',
+                     'Operations', 'Organizational', 'Contingency')
+
+# Year-over-year growth per benefit stream: productivity (+20%, +15%),
+# cost reduction (+30%, +20%), revenue (+50%, +40%), strategic (+20%, +15%).
+# Rows are year 1->2 and year 2->3.
+_BENEFIT_GROWTH = np.array([[1.2, 1.3, 1.5, 1.2],
+                            [1.15, 1.2, 1.4, 1.15]], dtype=np.float64)
+_BENEFIT_GROWTH.flags.writeable = False
+
+# Payback status by bucket: <=12 months, <=24 months, <=36 months, beyond 3 years
+_PAYBACK_BINS = (13, 25)
+_PAYBACK_STATUS = ((st.success, "✅ Excellent payback period"),
+                   (st.info, "ℹ️ Good payback period"),
+                   (st.warning, "⚠️ Long payback period - review assumptions"),
+                   (st.error, "❌ Payback beyond 3 years - significant risk"))
+
+# Sensitivity scenarios and their benefit multipliers
+_SCENARIOS = ('Pessimistic (70% of estimate)', 'Base Case (100%)', 'Optimistic (130% of estimate)')
+_SCENARIO_MULTIPLIERS = np.array([0.7, 1.0, 1.3])
+_SCENARIO_MULTIPLIERS.flags.writeable = False
+
+# ROI key risk factors, rendered once as severity-colored cards; anything
+# other than High/Medium is shown as low
+_RISK_FACTORS = (("Adoption slower than expected", "High"),
+                 ("Benefits take longer to realize", "Medium"),
+                 ("Costs higher than estimated", "Medium"),
+                 ("Model performance degrades", "Medium"),
+                 ("Regulatory changes", "Low-Medium"),
+                 ("Vendor pricing changes", "Medium"))
+_SEV_COLORS = {"High": "#dc3545", "Medium": "#ffc107"}
+_DEFAULT_SEV = "#28a745"
+_RISK_FACTOR_CARDS = "\n".join(
+    f"<div style='background-color:{_SEV_COLORS.get(severity, _DEFAULT_SEV)}20; padding:8px; border-radius:4px; margin:5px 0;'>"
+    f"<strong>{risk}</strong>: {severity}</div>"
+    for risk, severity in _RISK_FACTORS)
+
+# Metric value formatters
+_USD = "${:,.0f}".format
+_PCT = "{:.1f}%".format
+
+# Overview cost categories
+_COST_CATEGORIES = {
+    "Direct AI Costs": ["API/Model Usage", "Token Consumption", "Fine-tuning", "Embedding Generation", "Vector Database"],
+    "Infrastructure": ["Compute Resources", "Storage", "Networking", "Security", "Monitoring Tools", "Dev/Test/Prod Environments"],
+    "Development & Engineering": ["Team Salaries", "Tools & Platforms", "Testing & QA", "Integration Development", "Prompt Engineering"],
+    "Data Management": ["Data Preparation", "Data Quality", "Data Governance", "Data Storage", "Data Pipeline"],
+    "Operations & Maintenance": ["24/7 Support", "Incident Management", "Model Monitoring", "Performance Optimization", "Retraining"],
+    "Organizational": ["Change Management", "Training Programs", "Governance Framework", "Compliance", "Risk Management"],
+    "Risk & Contingency": ["Model Failure", "Accuracy Degradation", "Vendor Changes", "Regulatory Changes", "Security Incidents"]
 }
 
-DEMO_ROI_DATA = {
-    'roi_percentage': 63.4,
-    'payback_months': 1,
-    'npv': 0,
-    'total_benefits': 0,
-    'total_costs': 0
+# (column, category, bullet block) per Overview expander, laid out across 3 columns
+_CAT_EXPANDERS = tuple((idx % 3, category, "<br>".join(f"• {item}" for item in items))
+                       for idx, (category, items) in enumerate(_COST_CATEGORIES.items()))
+
+# Risk categories in display order, shared by the AI and manual assessments, and
+# their fixed heat-map colors (Plotly's default palette, in the same order)
+_RISK_CATEGORY_NAMES = ("Technical Risks", "Operational Risks", "Business Risks",
+                        "Compliance & Legal Risks", "Security Risks")
+_RISK_CATEGORY_COLORS = dict(zip(_RISK_CATEGORY_NAMES, ('#636EFA', '#EF553B', '#00CC96', '#AB63FA', '#FFA15A')))
+
+# Risk heat-map layout: 1-5 rating axes with dashed quadrant lines at 3
+_QUADRANT_LINE = dict(type='line', line=dict(color='gray', dash='dash'), opacity=0.5)
+_HEATMAP_LAYOUT = dict(
+    height=500,
+    xaxis=dict(range=(0.5, 5.5), dtick=1),
+    yaxis=dict(range=(0.5, 5.5), dtick=1),
+    shapes=(dict(_QUADRANT_LINE, xref='x domain', x0=0, x1=1, yref='y', y0=3, y1=3),
+            dict(_QUADRANT_LINE, xref='x', x0=3, x1=3, yref='y domain', y0=0, y1=1))
+)
+
+# Static HTML blocks - rendered once at import instead of on every rerun
+# The stylesheet lives in static/app.css and is inlined rather than linked: older
+# Streamlit servers send static .css files as text/plain, which browsers reject
+_APP_CSS = "<style>\n" + (Path(__file__).parent / "static" / "app.css").read_text(encoding="utf-8") + "\n</style>"
+
+_MODE_BOX_TMPL = Template("""
+    <div class="info-box">
+    <strong>$title</strong><br>
+    $body
+    </div>
+    """)
+
+_DEMO_BOX = _MODE_BOX_TMPL.substitute(
+    title="🎓 Demo Mode Active",
+    body="""Explore a complete example with realistic data for a Customer Service Chatbot implementation.
+    All fields are pre-populated. Navigate through tabs to see the full analysis.
+    Switch to <strong>Live Mode</strong> when ready to input your own data."""
+)
+
+_LIVE_BOX = _MODE_BOX_TMPL.substitute(
+    title="💼 Live Mode Active",
+    body="Enter your organization's data to calculate TCO and ROI. Need help? Switch to <strong>Demo Mode</strong> to see an example first."
+)
+
+_HEADER_HTML = """
+    <div class="main-header">
+        <h1 style="color: white; border: none; margin: 0; font-size: 2.5rem;">🤖 Gen AI ROI & TCO Calculator</h1>
+        <p style="color: #e3f2fd; font-size: 1.2rem; margin-top: 10px;">Enterprise-Grade Analysis for Informed AI Investment Decisions</p>
+    </div>
+"""
+
+_HOW_TO_USE_BOX = """
+    <div class="info-box">
+    <h3>📍 How to Use This Calculator</h3>
+    <p>Navigate through the tabs above in order:</p>
+    <ol>
+        <li><strong>Overview</strong> - Understand what costs to consider (you are here)</li>
+        <li><strong>Cost Analysis</strong> - Input your organization's cost data</li>
+        <li><strong>ROI Calculator</strong> - Estimate benefits and calculate returns</li>
+        <li><strong>Risk Assessment</strong> - Identify and quantify risks</li>
+        <li><strong>Summary Report</strong> - Review findings and export results</li>
+    </ol>
+    </div>
+    """
+
+_WHY_BOX = """
+    <div class="info-box">
+    <h3>Why This Calculator?</h3>
+    <p>Organizations often underestimate Gen AI costs by <strong>60-80%</strong> by focusing only on API costs. 
+    This calculator provides a comprehensive view of:</p>
+    <ul>
+        <li>Direct & Indirect Costs</li>
+        <li>Hidden Infrastructure Expenses</li>
+        <li>Organizational Change Costs</li>
+        <li>Risk-Adjusted Returns</li>
+        <li>Long-term Sustainability</li>
+    </ul>
+    </div>
+    """
+
+_OVERLOOKED_BOX = """
+    <div class="warning-box">
+    <h3>⚠️ Commonly Overlooked Factors</h3>
+    <ul>
+        <li>Model drift and retraining costs</li>
+        <li>Data preparation & quality management</li>
+        <li>Prompt engineering iterations</li>
+        <li>Governance & compliance overhead</li>
+        <li>Shadow IT and uncontrolled usage</li>
+        <li>Vendor lock-in risks</li>
+        <li>Skills gap and training needs</li>
+        <li>Integration complexity</li>
+    </ul>
+    </div>
+    """
+
+_SAMPLE_RECS_MD = """**⚡ Quick Wins**
+- **Optimize API Calls:** Potential savings of $45K/year
+- **Leverage Open Source:** Potential savings of $28K/year
+
+**💰 Cost Optimization**
+- **Right-size Infrastructure:** Potential savings of $36K/year"""
+
+_COMPARISON_FEATURES_MD = """**Feature Highlights:**
+- Save and compare 2-10 scenarios
+- Compare costs, benefits, and ROI
+- Identify best option by criteria"""
+
+_REPORT_CONTENTS_MD = """**Comprehensive 20+ Page Report includes:**
+- Executive summary & TOC
+- Methodology & assumptions
+- Detailed cost breakdown with charts
+- ROI & financial analysis
+- Risk assessment & mitigation
+- Implementation roadmap
+- Technology stack recommendations
+- Governance framework
+- Change management strategy
+- Success metrics & KPIs
+- Industry benchmarks
+- Appendices & glossary"""
+
+_FOOTER_HTML = """
+<div class="footer">
+<h3 style='color: #1f77b4; margin-bottom: 15px;'>Gen AI ROI & TCO Calculator</h3>
+<p style='margin: 10px 0;'><strong>Enterprise Decision Support Tool</strong></p>
+<p style='margin: 10px 0;'>Built with Streamlit | Comprehensive AI Investment Analysis</p>
+<p style='font-size: 0.9em; margin-top: 20px; color: #888;'>
+⚠️ <em>This calculator provides estimates based on inputs. Actual costs and benefits may vary.<br>
+Consult with financial and technical experts for major investment decisions.</em>
+</p>
+<p style='font-size: 0.85em; margin-top: 15px; color: #aaa;'>Version 1.0 | © 2024</p>
+</div>
+"""
+
+# Cost categories edited as one table each, one dict per line item: its label, an
+# optional help text (shown in a Notes column) and its fields as state key -> default,
+# one field per value column
+_INFRA_ROWS = (
+    {'label': "Monthly Compute Resources (EC2, Lambda, etc.)",
+     'help': "Development, staging, production environments", 'fields': {'compute_cost': 2000}},
+    {'label': "Monthly Storage (S3, databases, logs)", 'fields': {'storage_cost': 500}},
+    {'label': "Monthly Networking (Data transfer, VPC)", 'fields': {'networking_cost': 300}},
+    {'label': "Monthly Security & Compliance Tools",
+     'help': "WAF, GuardDuty, Security Hub, etc.", 'fields': {'security_tools': 1000}},
+    {'label': "Monthly Monitoring & Observability",
+     'help': "CloudWatch, DataDog, New Relic, etc.", 'fields': {'monitoring_tools': 800}},
+    {'label': "Monthly Backup & Disaster Recovery", 'fields': {'backup_dr': 400}},
+)
+_INFRA_COLS = {"Monthly USD": st.column_config.NumberColumn(min_value=0, step=1)}
+_DEV_ROWS = (
+    {'label': "AI/ML Engineers", 'fields': {'ai_engineers': 2.0, 'ai_engineer_cost': 180000}},
+    {'label': "Backend Developers", 'fields': {'backend_devs': 2.0, 'backend_cost': 150000}},
+    {'label': "Frontend Developers", 'fields': {'frontend_devs': 1.0, 'frontend_cost': 130000}},
+    {'label': "QA/Test Engineers", 'fields': {'qa_engineers': 1.0, 'qa_cost': 120000}},
+)
+_DEV_COLS = {"FTE": st.column_config.NumberColumn(min_value=0.0, step=0.5),
+             "Annual Cost per FTE (USD)": st.column_config.NumberColumn(
+                 min_value=0, step=1, help="Salary + benefits + overhead")}
+_ORG_ROWS = (
+    {'label': "Annual User Training Programs",
+     'help': "Training materials, sessions, platforms", 'fields': {'training_cost': 50000}},
+    {'label': "Change Management Investment",
+     'help': "Communication, adoption programs", 'fields': {'change_mgmt': 75000}},
+    {'label': "Annual Governance & Compliance",
+     'help': "Policies, audits, risk management", 'fields': {'governance_cost': 60000}},
+    {'label': "Annual Legal & IP Review",
+     'help': "Contract review, IP protection", 'fields': {'legal_cost': 40000}},
+)
+_ORG_COLS = {"Annual USD": st.column_config.NumberColumn(min_value=0, step=1)}
+
+# Sections - only the selected one runs on each rerun
+_SECTIONS = ("📊 Overview", "💰 Cost Analysis", "📈 ROI Calculator", "⚠️ Risk Assessment",
+             "🤖 AI Recommendations", "🔍 Model Selector", "🔄 Comparison Mode", "📋 Summary Report")
+
+# Keyed input widgets and their Live-mode defaults per section - seeded into session
+# state instead of passed as value=/index=, and restored from a shadow copy after
+# leaving their section
+_SECTION_WIDGETS = {
+    "💰 Cost Analysis": {
+        'org_name': '', 'industry': 'Technology', 'org_size': '500-1000', 'maturity': 'Pilot',
+        'use_case': 'Customer Service/Chatbots', 'expected_users': 100,
+        'show_guide': False, 'show_ranges': False, 'cu': 100, 'cr': 20, 'ct': 1500, 'cc': 15.0, 'cg': 25,
+        'model_provider': 'Anthropic (Claude)', 'avg_tokens_per_request': 2000, 'requests_per_day': 1000,
+        'cost_per_million_tokens': 15.0, 'growth_rate': 50, 'embedding_cost': 500,
+        'dev_tools': 50000, 'data_engineers': 1.0, 'data_engineer_cost': 160000, 'data_prep_cost': 50000,
+        'data_quality_tools': 30000, 'data_labeling': 40000, 'ops_engineers': 1.0, 'ops_cost': 170000,
+        'support_staff': 1.0, 'support_cost': 100000, 'incident_mgmt': 30000, 'model_retraining': 50000,
+        'contingency_pct': 15, 'vendor_lock_in': "No strategy (High Risk)"
+    },
+    "📈 ROI Calculator": {
+        'time_saved_per_user': 5.0, 'hourly_rate': 75, 'affected_users': 100, 'productivity_pct': 70,
+        'customer_service_reduction': 100000, 'process_automation_value': 150000,
+        'error_reduction_value': 50000, 'cost_reduction_confidence': 60, 'new_revenue': 200000,
+        'customer_retention': 100000, 'revenue_confidence': 50, 'competitive_advantage': 150000,
+        'innovation_value': 100000, 'strategic_confidence': 50
+    },
+    "⚠️ Risk Assessment": {'risk_notes': ''}
 }
+_WIDGET_DEFAULTS = {key: default for widgets in _SECTION_WIDGETS.values()
+                    for key, default in widgets.items()}
+
+@st.cache_data(show_spinner=False)
+def compute_api_costs(requests_per_day, avg_tokens, cost_per_m, embedding):
+    """Annualize API token and embedding spend for year 1"""
+    annual_requests = requests_per_day * 365
+    total_tokens = annual_requests * avg_tokens
+    year1_api = (total_tokens / 1_000_000) * cost_per_m
+    year1_emb = embedding * 12
+    
+    return {
+        'year1_api': year1_api,
+        'year1_emb': year1_emb
+    }
+
+@st.cache_data(show_spinner=False)
+def _benchmark_tables():
+    """Build the static Cost Ranges tables once with explicit string dtypes"""
+    return tuple(pd.DataFrame.from_records(rows, columns=cols).astype("string")
+                 for rows, cols in ((_IND_ROWS, _IND_COLS),
+                                    (_MATURITY_ROWS, _MATURITY_COLS),
+                                    (_CASE_ROWS, _CASE_COLS)))
+
+@st.cache_data(show_spinner=False)
+def _sample_scenarios_df():
+    """Build the static Comparison Mode sample table once"""
+    return pd.DataFrame({
+        'Scenario': ['Conservative', 'Baseline', 'Aggressive'],
+        '3-Year TCO': ['$2.1M', '$2.8M', '$3.5M'],
+        'ROI %': ['145%', '175%', '220%']
+    })
+
+@st.cache_data(show_spinner=False)
+def _demo_cost_roi():
+    """Summary Report demo payload as (cost_data, roi_data); callers get their own copies"""
+    return ({
+        'org_name': 'TechCorp Solutions',
+        'industry': 'Technology',
+        'use_case': 'Customer Service',
+        'year1_total': 950000,
+        'year2_total': 1150000,
+        'year3_total': 1380000,
+        'three_year_tco': 3480000
+    }, {
+        'three_year_benefits': 3880000,
+        'roi_percentage': 175,
+        'payback_months': 18,
+        'net_benefit': 400000
+    })
+
+@st.cache_data(show_spinner=False)
+def compute_cost_data(year1_bases, growth_rate, contingency_pct):
+    """
+    Project year-1 category costs over three years and add contingency
+    
+    Args:
+        year1_bases: Year-1 costs as (API, embedding, infrastructure, development,
+            data, operations, organizational)
+        growth_rate: Annual API usage growth (%)
+        contingency_pct: Contingency reserve (%)
+    """
+    # One row per year, one column per cost category
+    bases = np.array(year1_bases, dtype=np.float64)
+    growth = _GROWTH.copy()
+    growth[:, :2] = 1 + growth_rate/100  # API and embedding follow usage growth
+    proj = bases * np.vstack([np.ones(7), np.cumprod(growth, axis=0)])
+    
+    year_subtotals = proj.sum(axis=1)
+    year_contingency = year_subtotals * (contingency_pct / 100)
+    year_totals = year_subtotals + year_contingency
+    
+    year1_total, year2_total, year3_total = (float(total) for total in year_totals)
+    year1_api_cost, year1_embedding, year1_infra, year1_dev, year1_data, year1_ops, year1_org = year1_bases
+    
+    return {
+        'year1_total': year1_total,
+        'year2_total': year2_total,
+        'year3_total': year3_total,
+        'three_year_tco': year1_total + year2_total + year3_total,
+        'year1_breakdown': dict(zip(_BREAKDOWN_LABELS, (
+            year1_api_cost + year1_embedding, year1_infra, year1_dev, year1_data,
+            year1_ops, year1_org, float(year_contingency[0])
+        )))
+    }
+
+def _cost_key(values):
+    """
+    compute_cost_data arguments for a set of Cost Analysis inputs
+    
+    Args:
+        values: Cost widget and line-item state key -> value (session state, or
+            the defaults before Cost Analysis has been opened)
+    """
+    api_costs = compute_api_costs(values['requests_per_day'], values['avg_tokens_per_request'],
+                                  values['cost_per_million_tokens'], values['embedding_cost'])
+    
+    year1_infra = 0
+    for row in _INFRA_ROWS:
+        for field in row['fields']:
+            year1_infra += values[field] * 12
+    
+    year1_dev = values['dev_tools']
+    for row in _DEV_ROWS:
+        fte_field, cost_field = row['fields']
+        year1_dev += values[fte_field] * values[cost_field]
+    
+    year1_data = (values['data_engineers'] * values['data_engineer_cost'] + values['data_prep_cost'] +
+                  values['data_quality_tools'] + values['data_labeling'])
+    year1_ops = (values['ops_engineers'] * values['ops_cost'] + values['support_staff'] * values['support_cost'] +
+                 values['incident_mgmt'] + values['model_retraining'])
+    
+    year1_org = 0
+    for row in _ORG_ROWS:
+        for field in row['fields']:
+            year1_org += values[field]
+    
+    return ((api_costs['year1_api'], api_costs['year1_emb'], year1_infra, year1_dev, year1_data,
+             year1_ops, year1_org), values['growth_rate'], values['contingency_pct'])
+
+@st.cache_data(show_spinner=False)
+def compute_roi_data(cost_totals, benefit_inputs):
+    """
+    Project benefits with confidence adjustments and derive ROI and payback
+    
+    Args:
+        cost_totals: (year1_total, year2_total, year3_total, three_year_tco)
+        benefit_inputs: ROI Calculator inputs, in the order they appear on the tab
+    """
+    (time_saved_per_user, hourly_rate, affected_users, productivity_pct,
+     customer_service_reduction, process_automation_value, error_reduction_value,
+     cost_reduction_confidence, new_revenue, customer_retention, revenue_confidence,
+     competitive_advantage, innovation_value, strategic_confidence) = benefit_inputs
+    year1_total, year2_total, year3_total, three_year_tco = cost_totals
+    
+    annual_time_saved = time_saved_per_user * affected_users * 52  # weeks per year
+    
+    # Year-1 value of each benefit stream after its confidence adjustment
+    streams_year1 = np.array([
+        annual_time_saved * hourly_rate * (productivity_pct / 100),
+        (customer_service_reduction + process_automation_value +
+         error_reduction_value) * (cost_reduction_confidence / 100),
+        (new_revenue + customer_retention) * (revenue_confidence / 100),
+        (competitive_advantage + innovation_value) * (strategic_confidence / 100)
+    ], dtype=np.float64)
+    
+    # One row per year, one column per benefit stream
+    proj = streams_year1 * np.vstack([np.ones(4), np.cumprod(_BENEFIT_GROWTH, axis=0)])
+    year_benefits = proj.sum(axis=1)
+    
+    year1_benefits, year2_benefits, year3_benefits = (float(total) for total in year_benefits)
+    three_year_benefits = year1_benefits + year2_benefits + year3_benefits
+    
+    net_benefit = three_year_benefits - three_year_tco
+    roi_percentage = ((three_year_benefits - three_year_tco) / three_year_tco) * 100 if three_year_tco > 0 else 0
+    
+    # Payback period - first month where cumulative benefits cover cumulative costs
+    monthly_benefits = np.repeat(np.array([year1_benefits, year2_benefits, year3_benefits]) / 12, 12)
+    monthly_costs = np.repeat(np.array([year1_total, year2_total, year3_total]) / 12, 12)
+    covered = np.cumsum(monthly_benefits) >= np.cumsum(monthly_costs)
+    payback_months = int(covered.argmax()) + 1 if covered.any() else "36+"
+    
+    return {
+        'year1_benefits': year1_benefits,
+        'year2_benefits': year2_benefits,
+        'year3_benefits': year3_benefits,
+        'three_year_benefits': three_year_benefits,
+        'net_benefit': net_benefit,
+        'roi_percentage': roi_percentage,
+        'payback_months': payback_months
+    }
+
+@st.cache_data(show_spinner=False)
+def _build_comparison_fig(costs, benefits):
+    """Annual Costs vs Benefits grouped bar chart for (year1, year2, year3) tuples"""
+    years = ['Year 1', 'Year 2', 'Year 3']
+    fig = go.Figure()
+    hover = '$%{y:,.0f}'
+    fig.add_trace(go.Bar(name='Costs', x=years, y=list(costs), marker_color='#ff7f0e', hovertemplate=hover))
+    fig.add_trace(go.Bar(name='Benefits', x=years, y=list(benefits), marker_color='#2ca02c', hovertemplate=hover))
+    # One hover label per year for both bars
+    fig.update_layout(title="Annual Costs vs Benefits", barmode='group', height=300, hovermode='x unified')
+    return fig
+
+@st.cache_data(show_spinner=False)
+def _build_scenario_fig(scenarios, roi_values):
+    """ROI Under Different Scenarios bar chart"""
+    fig = go.Figure()
+    fig.add_trace(go.Bar(x=list(scenarios), y=list(roi_values),
+                        marker_color=['#ff7f0e', '#1f77b4', '#2ca02c']))
+    fig.update_layout(title="ROI Under Different Scenarios", 
+                    yaxis_title="ROI %", height=300)
+    return fig
+
+@st.cache_data(show_spinner=False)
+def _build_risk_df(risks_json):
+    """Flatten JSON-encoded risk categories into one row per risk"""
+    # One list per column; ratings are 1-5 so they fit in int8 and so do their products
+    names_col, cats_col, like_col, imp_col = [], [], [], []
+    for category, risks in json.loads(risks_json).items():
+        for risk_name, risk_data in risks.items():
+            names_col.append(risk_name)
+            cats_col.append(category)
+            like_col.append(risk_data['likelihood'])
+            imp_col.append(risk_data['impact'])
+    
+    likes = np.array(like_col, dtype=np.int8)
+    imps = np.array(imp_col, dtype=np.int8)
+    names = pd.Series(names_col, dtype=object)
+    
+    return pd.DataFrame({
+        'Risk': names.where(names.str.len() <= 40, names.str.slice(0, 40) + '...'),
+        'Category': cats_col,
+        'Likelihood': likes,
+        'Impact': imps,
+        'Score': likes * imps
+    })
+
+@st.cache_resource(show_spinner=False, max_entries=32)
+def _build_heatmap_fig(risks_json):
+    """AI-generated Risk Heat Map scatter with quadrant lines, from JSON-encoded risk categories"""
+    risk_df = _build_risk_df(risks_json)
+    fig = px.scatter(risk_df, x='Likelihood', y='Impact', size='Score', 
+                   color='Category', color_discrete_map=_RISK_CATEGORY_COLORS,
+                   category_orders={'Category': _RISK_CATEGORY_NAMES}, hover_data=['Risk'],
+                   title="Risk Heat Map (AI-Generated)",
+                   labels={'Likelihood': 'Likelihood →', 'Impact': 'Impact →'},
+                   size_max=30, render_mode='webgl')
+    
+    fig.update_layout(_HEATMAP_LAYOUT)
+    return fig
+
+def _dict_cache_key(d):
+    """Cheap cache key for the flat report dicts - their repr instead of a pickle"""
+    return repr(sorted(d.items()))
+
+@st.cache_data(show_spinner=False, ttl=600, max_entries=16, hash_funcs={dict: _dict_cache_key})
+def _build_pdf(cost_data, roi_data, risk_data, generated_at):
+    """Render the comprehensive PDF report; the bytes depend only on the arguments"""
+    return generate_comprehensive_pdf_report(
+        cost_data=cost_data,
+        roi_data=roi_data,
+        risk_data=risk_data,
+        generated_at=generated_at
+    )
+
+def _pdf_download(cost_data, roi_data, risk_data, generated_at, failures):
+    """
+    Deferred download data for the PDF report
+    
+    The download runs the callable on its own thread, where Streamlit commands are
+    ignored, so a failure is logged and kept in `failures` for the page to report.
+    """
+    try:
+        return _build_pdf(cost_data, roi_data, risk_data, generated_at)
+    except Exception as e:
+        _LOGGER.exception("PDF report generation failed")
+        failures['pdf'] = str(e)
+        raise
+
+def _line_item_editor(rows, columns, key):
+    """
+    Edit a cost category as one fixed-row table instead of a widget per field
+    
+    Args:
+        rows: Line item dicts with 'label', optional 'help' and 'fields'
+            (state key -> default, in column order)
+        columns: Value column name -> st.column_config column
+        key: Widget key for the table
+    
+    Each edited value is also stored under its field's state key as a plain Python
+    number, so it survives leaving the section and stays readable under the field's
+    usual name.
+    """
+    has_notes = any(row.get('help') for row in rows)
+    records = []
+    for row in rows:
+        record = {'Item': row['label']}
+        for column, (field, default) in zip(columns, row['fields'].items()):
+            record[column] = st.session_state.get(field, default)
+        if has_notes:
+            record['Notes'] = row.get('help', '')
+        records.append(record)
+    
+    edited = st.data_editor(pd.DataFrame(records), key=key, num_rows="fixed", hide_index=True,
+                            width="stretch", disabled=('Item', 'Notes'), column_config=columns).fillna(0)
+    
+    for position, row in enumerate(rows):
+        for column, field in zip(columns, row['fields']):
+            st.session_state[field] = edited[column].iat[position].item()
+    return edited
 
 # Page configuration
 st.set_page_config(
@@ -55,169 +631,9 @@ st.set_page_config(
     initial_sidebar_state="collapsed"
 )
 
-# Custom CSS for professional appearance
-st.markdown("""
-    <style>
-    /* Main container styling */
-    .main {
-        padding: 1rem 2rem;
-        max-width: 1400px;
-        margin: 0 auto;
-    }
-    
-    /* Header styling */
-    .main-header {
-        text-align: center;
-        padding: 2rem 0;
-        background: linear-gradient(135deg, #1f77b4 0%, #2c5aa0 100%);
-        color: white;
-        border-radius: 10px;
-        margin-bottom: 2rem;
-        box-shadow: 0 4px 6px rgba(0,0,0,0.1);
-    }
-    
-    /* Navigation styling */
-    .stTabs [data-baseweb="tab-list"] {
-        gap: 8px;
-        background-color: #f8f9fa;
-        padding: 10px;
-        border-radius: 10px;
-        margin-bottom: 2rem;
-    }
-    
-    .stTabs [data-baseweb="tab"] {
-        height: 60px;
-        padding: 0 24px;
-        background-color: white;
-        border-radius: 8px;
-        font-weight: 500;
-        border: 2px solid transparent;
-        transition: all 0.3s ease;
-    }
-    
-    .stTabs [data-baseweb="tab"]:hover {
-        background-color: #e3f2fd;
-        border-color: #1f77b4;
-    }
-    
-    .stTabs [aria-selected="true"] {
-        background-color: #1f77b4 !important;
-        color: white !important;
-        border-color: #1f77b4 !important;
-    }
-    
-    /* Metric styling */
-    .stMetric {
-        background-color: #ffffff;
-        padding: 20px;
-        border-radius: 10px;
-        border-left: 5px solid #1f77b4;
-        box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-    }
-    
-    /* Info boxes */
-    .warning-box {
-        background-color: #fff3cd;
-        border-left: 5px solid #ffc107;
-        padding: 20px;
-        border-radius: 8px;
-        margin: 15px 0;
-        box-shadow: 0 2px 4px rgba(0,0,0,0.05);
-    }
-    
-    .success-box {
-        background-color: #d4edda;
-        border-left: 5px solid #28a745;
-        padding: 20px;
-        border-radius: 8px;
-        margin: 15px 0;
-        box-shadow: 0 2px 4px rgba(0,0,0,0.05);
-    }
-    
-    .info-box {
-        background-color: #d1ecf1;
-        border-left: 5px solid #17a2b8;
-        padding: 20px;
-        border-radius: 8px;
-        margin: 15px 0;
-        box-shadow: 0 2px 4px rgba(0,0,0,0.05);
-    }
-    
-    /* Section headers */
-    h1 {
-        color: #1f77b4;
-        padding-bottom: 15px;
-        border-bottom: 3px solid #1f77b4;
-        margin-bottom: 20px;
-    }
-    
-    h2 {
-        color: #2c5aa0;
-        margin-top: 30px;
-        padding-bottom: 10px;
-        border-bottom: 2px solid #e0e0e0;
-    }
-    
-    h3 {
-        color: #1f77b4;
-        margin-top: 20px;
-    }
-    
-    /* Cards and containers */
-    .stExpander {
-        border: 1px solid #e0e0e0;
-        border-radius: 8px;
-        margin-bottom: 10px;
-        background-color: white;
-    }
-    
-    /* Input fields */
-    .stNumberInput, .stSelectbox, .stTextInput {
-        background-color: white;
-    }
-    
-    /* Buttons */
-    .stButton > button {
-        background-color: #1f77b4;
-        color: white;
-        border-radius: 8px;
-        padding: 10px 24px;
-        border: none;
-        font-weight: 500;
-        transition: all 0.3s ease;
-    }
-    
-    .stButton > button:hover {
-        background-color: #1557a0;
-        box-shadow: 0 4px 8px rgba(0,0,0,0.2);
-    }
-    
-    /* Download buttons */
-    .stDownloadButton > button {
-        background-color: #28a745;
-        color: white;
-    }
-    
-    .stDownloadButton > button:hover {
-        background-color: #218838;
-    }
-    
-    /* Sidebar (minimized) */
-    [data-testid="stSidebar"] {
-        display: none;
-    }
-    
-    /* Footer */
-    .footer {
-        text-align: center;
-        padding: 30px;
-        background-color: #f8f9fa;
-        border-radius: 10px;
-        margin-top: 50px;
-        color: #666;
-    }
-    </style>
-""", unsafe_allow_html=True)
+# Custom CSS for professional appearance - re-emitted on every run, since
+# Streamlit drops elements that a rerun does not output again
+st.markdown(_APP_CSS, unsafe_allow_html=True)
 
 # Initialize session state
 if 'calculation_done' not in st.session_state:
@@ -305,13 +721,23 @@ DEMO_DATA = {
     }
 }
 
+# Streamlit drops the state of widgets that are not rendered in a run. The values of
+# the section rendered last run are copied to a shadow dict, and every other section's
+# keys are restored from it (or seeded with their defaults). Widgets that stay on
+# screen are never rewritten - that would push the value back to the browser and
+# discard edits typed into the cost form but not yet submitted
+_widget_values = st.session_state.setdefault('_widget_values', {})
+_shown_section = st.session_state.get('_shown_section')
+for _widget_section, _widgets in _SECTION_WIDGETS.items():
+    for _key, _default in _widgets.items():
+        if _widget_section == _shown_section and _key in st.session_state:
+            _widget_values[_key] = st.session_state[_key]
+        else:
+            st.session_state[_key] = _widget_values.get(_key, _default)
+st.session_state._shown_section = st.session_state.get('section', _SECTIONS[0])
+
 # Header with professional styling
-st.markdown("""
-    <div class="main-header">
-        <h1 style="color: white; border: none; margin: 0; font-size: 2.5rem;">🤖 Gen AI ROI & TCO Calculator</h1>
-        <p style="color: #e3f2fd; font-size: 1.2rem; margin-top: 10px;">Enterprise-Grade Analysis for Informed AI Investment Decisions</p>
-    </div>
-""", unsafe_allow_html=True)
+st.markdown(_HEADER_HTML, unsafe_allow_html=True)
 
 # Mode Selector
 st.markdown("---")
@@ -326,32 +752,35 @@ with col2:
         help="Demo Mode: See a complete example with sample data | Live Mode: Enter your own data"
     )
     
-    # Update session state based on selection
-    if mode == "🎓 Demo Mode" and st.session_state.app_mode != 'Demo':
-        st.session_state.app_mode = 'Demo'
-        st.session_state.demo_loaded = False
-        st.rerun()
-    elif mode == "💼 Live Mode" and st.session_state.app_mode != 'Live':
-        st.session_state.app_mode = 'Live'
-        st.rerun()
+    # Update session state based on selection - the radio change already
+    # triggered this run, so everything below renders in the new mode
+    new_mode = 'Demo' if mode == "🎓 Demo Mode" else 'Live'
+    if new_mode != st.session_state.app_mode:
+        st.session_state.app_mode = new_mode
+        if new_mode == 'Demo':
+            st.session_state.demo_loaded = False
+        # Reload the fields with demo values with this mode's values
+        _mode_values = {**DEMO_DATA['org_profile'], **DEMO_DATA['ai_costs']}
+        if new_mode == 'Live':
+            _mode_values = {_key: _WIDGET_DEFAULTS[_key] for _key in _mode_values}
+        _widget_values.update(_mode_values)
+        st.session_state.update(_mode_values)
 
 # Mode explanation
-if st.session_state.app_mode == 'Demo':
-    st.markdown("""
-    <div class="info-box">
-    <strong>🎓 Demo Mode Active</strong><br>
-    Explore a complete example with realistic data for a Customer Service Chatbot implementation.
-    All fields are pre-populated. Navigate through tabs to see the full analysis.
-    Switch to <strong>Live Mode</strong> when ready to input your own data.
-    </div>
-    """, unsafe_allow_html=True)
-else:
-    st.markdown("""
-    <div class="info-box">
-    <strong>💼 Live Mode Active</strong><br>
-    Enter your organization's data to calculate TCO and ROI. Need help? Switch to <strong>Demo Mode</strong> to see an example first.
-    </div>
-    """, unsafe_allow_html=True)
+st.markdown(_DEMO_BOX if st.session_state.app_mode == 'Demo' else _LIVE_BOX, unsafe_allow_html=True)
+
+# Until Cost Analysis has calculated the costs, the other sections work from the
+# current cost inputs - their defaults, or the demo values in Demo mode
+if '_last_cost_key' not in st.session_state:
+    _cost_values = {}
+    for _rows in (_INFRA_ROWS, _DEV_ROWS, _ORG_ROWS):
+        for _row in _rows:
+            _cost_values.update(_row['fields'])
+    for _key in _SECTION_WIDGETS["💰 Cost Analysis"]:
+        _cost_values[_key] = st.session_state[_key]
+    st.session_state.cost_data = dict(compute_cost_data(*_cost_key(_cost_values)),
+                                      org_name=_cost_values['org_name'], industry=_cost_values['industry'],
+                                      use_case=_cost_values['use_case'])
 
 # Enable auto-save functionality (temporarily disabled)
 # enable_auto_save(interval_seconds=30)
@@ -361,98 +790,38 @@ else:
 # render_save_load_ui()
 # st.markdown("---")
 
-# Create centered tabs for navigation
-tab1, tab2, tab3, tab4, tab5, tab6, tab7, tab8 = st.tabs([
-    "📊 Overview", 
-    "💰 Cost Analysis", 
-    "📈 ROI Calculator", 
-    "⚠️ Risk Assessment",
-    "🤖 AI Recommendations",
-    "🔍 Model Selector",
-    "🔄 Comparison Mode", 
-    "📋 Summary Report"
-])
+# Section navigation - unlike st.tabs, only the selected section's code runs
+section = st.radio("Section", _SECTIONS, horizontal=True, key="section",
+                   label_visibility="collapsed")
 
 # Tab 1: Overview Section
-with tab1:
+if section == "📊 Overview":
     st.header("Understanding the True Cost of Gen AI Implementation")
     
-    st.markdown("""
-    <div class="info-box">
-    <h3>📍 How to Use This Calculator</h3>
-    <p>Navigate through the tabs above in order:</p>
-    <ol>
-        <li><strong>Overview</strong> - Understand what costs to consider (you are here)</li>
-        <li><strong>Cost Analysis</strong> - Input your organization's cost data</li>
-        <li><strong>ROI Calculator</strong> - Estimate benefits and calculate returns</li>
-        <li><strong>Risk Assessment</strong> - Identify and quantify risks</li>
-        <li><strong>Summary Report</strong> - Review findings and export results</li>
-    </ol>
-    </div>
-    """, unsafe_allow_html=True)
+    st.markdown(_HOW_TO_USE_BOX, unsafe_allow_html=True)
     
     st.markdown("---")
     
     col1, col2 = st.columns(2)
     
     with col1:
-        st.markdown("""
-        <div class="info-box">
-        <h3>Why This Calculator?</h3>
-        <p>Organizations often underestimate Gen AI costs by <strong>60-80%</strong> by focusing only on API costs. 
-        This calculator provides a comprehensive view of:</p>
-        <ul>
-            <li>Direct & Indirect Costs</li>
-            <li>Hidden Infrastructure Expenses</li>
-            <li>Organizational Change Costs</li>
-            <li>Risk-Adjusted Returns</li>
-            <li>Long-term Sustainability</li>
-        </ul>
-        </div>
-        """, unsafe_allow_html=True)
+        st.markdown(_WHY_BOX, unsafe_allow_html=True)
     
     with col2:
-        st.markdown("""
-        <div class="warning-box">
-        <h3>⚠️ Commonly Overlooked Factors</h3>
-        <ul>
-            <li>Model drift and retraining costs</li>
-            <li>Data preparation & quality management</li>
-            <li>Prompt engineering iterations</li>
-            <li>Governance & compliance overhead</li>
-            <li>Shadow IT and uncontrolled usage</li>
-            <li>Vendor lock-in risks</li>
-            <li>Skills gap and training needs</li>
-            <li>Integration complexity</li>
-        </ul>
-        </div>
-        """, unsafe_allow_html=True)
+        st.markdown(_OVERLOOKED_BOX, unsafe_allow_html=True)
     
     st.markdown("---")
     
     # Cost categories overview
     st.subheader("📑 Comprehensive Cost Categories")
     
-    cost_categories = {
-        "Direct AI Costs": ["API/Model Usage", "Token Consumption", "Fine-tuning", "Embedding Generation", "Vector Database"],
-        "Infrastructure": ["Compute Resources", "Storage", "Networking", "Security", "Monitoring Tools", "Dev/Test/Prod Environments"],
-        "Development & Engineering": ["Team Salaries", "Tools & Platforms", "Testing & QA", "Integration Development", "Prompt Engineering"],
-        "Data Management": ["Data Preparation", "Data Quality", "Data Governance", "Data Storage", "Data Pipeline"],
-        "Operations & Maintenance": ["24/7 Support", "Incident Management", "Model Monitoring", "Performance Optimization", "Retraining"],
-        "Organizational": ["Change Management", "Training Programs", "Governance Framework", "Compliance", "Risk Management"],
-        "Risk & Contingency": ["Model Failure", "Accuracy Degradation", "Vendor Changes", "Regulatory Changes", "Security Incidents"]
-    }
-    
     cols = st.columns(3)
-    for idx, (category, items) in enumerate(cost_categories.items()):
-        with cols[idx % 3]:
-            with st.expander(f"**{category}**"):
-                for item in items:
-                    st.markdown(f"• {item}")
+    for col_idx, category, bullets in _CAT_EXPANDERS:
+        cols[col_idx].expander(f"**{category}**").markdown(bullets, unsafe_allow_html=True)
 
 
 # Tab 2: Cost Analysis Section
-with tab2:
+if section == "💰 Cost Analysis":
     st.header("Detailed Cost Analysis")
     
     # Load demo data if in demo mode and not yet loaded
@@ -460,56 +829,35 @@ with tab2:
         st.info("📊 Loading demo data... This represents a typical mid-size Customer Service Chatbot implementation.")
         st.session_state.demo_loaded = True
     
-    st.markdown("""
-    <div class="info-box">
-    <strong>Instructions:</strong> Fill in all relevant fields. Use conservative estimates where uncertain. 
-    All costs should be in USD and on an annual basis unless specified otherwise.
-    """ + (" <br><strong>🎓 Demo Mode:</strong> All fields are pre-filled with realistic example data." if st.session_state.app_mode == 'Demo' else "") + """
-    </div>
-    """, unsafe_allow_html=True)
+    st.info("**Instructions:** Fill in all relevant fields. Use conservative estimates where uncertain. "
+            "All costs should be in USD and on an annual basis unless specified otherwise."
+            + ("  \n**🎓 Demo Mode:** All fields are pre-filled with realistic example data."
+               if st.session_state.app_mode == 'Demo' else ""))
     
     # Organization Profile
     st.subheader("🏢 Organization Profile")
     col1, col2, col3 = st.columns(3)
     
-    # Helper function to get demo value
-    def get_demo_value(section, key, default):
-        if st.session_state.app_mode == 'Demo':
-            return DEMO_DATA.get(section, {}).get(key, default)
-        return default
-    
     with col1:
         org_name = st.text_input("Organization Name", 
-            value=get_demo_value('org_profile', 'org_name', ''),
-            placeholder="Your Company Inc.")
+            placeholder="Your Company Inc.", key='org_name')
         industry = st.selectbox("Industry", 
-            ["Financial Services", "Healthcare", "Technology", "Manufacturing", "Retail", "Government", "Other"],
-            index=["Financial Services", "Healthcare", "Technology", "Manufacturing", "Retail", "Government", "Other"].index(
-                get_demo_value('org_profile', 'industry', 'Technology')))
+            _INDUSTRIES, key='industry')
     
     with col2:
         org_size = st.selectbox("Organization Size", 
-            ["<100", "100-500", "500-1000", "1000-5000", "5000+"],
-            index=["<100", "100-500", "500-1000", "1000-5000", "5000+"].index(
-                get_demo_value('org_profile', 'org_size', '500-1000')))
-        st.session_state.org_size = org_size  # Store for AI risk assessment
+            _ORG_SIZES,
+            key='org_size')  # Bound to session state for AI risk assessment
         
         maturity = st.selectbox("AI Maturity Level", 
-            ["Exploring", "Pilot", "Scaling", "Mature"],
-            index=["Exploring", "Pilot", "Scaling", "Mature"].index(
-                get_demo_value('org_profile', 'maturity', 'Pilot')))
-        st.session_state.maturity = maturity  # Store for AI risk assessment
+            _MATURITIES,
+            key='maturity')  # Bound to session state for AI risk assessment
     
     with col3:
         use_case = st.selectbox("Primary Use Case", 
-            ["Customer Service/Chatbots", "Content Generation", "Code Assistance", "Data Analysis", 
-             "Document Processing", "Knowledge Management", "Multiple Use Cases"],
-            index=["Customer Service/Chatbots", "Content Generation", "Code Assistance", "Data Analysis", 
-             "Document Processing", "Knowledge Management", "Multiple Use Cases"].index(
-                get_demo_value('org_profile', 'use_case', 'Customer Service/Chatbots')))
+            _USE_CASES, key='use_case')
         expected_users = st.number_input("Expected Active Users", 
-            min_value=1, 
-            value=int(get_demo_value('org_profile', 'expected_users', 100)))
+            min_value=1, key='expected_users')
     
     st.markdown("---")
     
@@ -530,43 +878,12 @@ with tab2:
     with col1:
         if st.button("🎯 Use Smart Defaults", type="primary", help="Auto-fill with industry-standard estimates", key="smart_defaults_btn"):
             # Smart defaults based on org profile
-            use_case_multipliers = {
-                'Customer Service/Chatbots': 30, 'Content Generation': 10,
-                'Code Assistance': 25, 'Data Analysis': 15,
-                'Document Processing': 8, 'Knowledge Management': 12,
-                'Multiple Use Cases': 20
-            }
-            
-            smart_requests = int(expected_users * use_case_multipliers.get(use_case, 20))
-            
-            use_case_tokens = {
-                'Customer Service/Chatbots': 1800, 'Content Generation': 4500,
-                'Code Assistance': 3000, 'Data Analysis': 3500,
-                'Document Processing': 5000, 'Knowledge Management': 2500,
-                'Multiple Use Cases': 2500
-            }
-            
-            smart_tokens = use_case_tokens.get(use_case, 2000)
-            
-            industry_costs = {
-                'Financial Services': 18.0, 'Healthcare': 18.0, 'Government': 20.0,
-                'Technology': 12.0, 'Manufacturing': 12.0, 'Retail': 15.0, 'Other': 15.0
-            }
-            
-            smart_cost_per_m = industry_costs.get(industry, 15.0)
-            
-            maturity_infra = {
-                'Exploring': 1500, 'Pilot': 5000, 'Scaling': 15000, 'Mature': 50000
-            }
-            
-            smart_infra = maturity_infra.get(maturity, 5000)
-            
-            size_dev = {
-                '<100': 250000, '100-500': 450000, '500-1000': 700000,
-                '1000-5000': 1200000, '5000+': 2500000
-            }
-            
-            smart_dev = size_dev.get(org_size, 450000)
+            uc = _UC_IDX[use_case]
+            smart_requests = int(expected_users * int(_UC_REQ[uc]))
+            smart_tokens = int(_UC_TOKENS[uc])
+            smart_cost_per_m = float(_IND_COST_PER_M[_INDUSTRY_IDX[industry]])
+            smart_infra = int(_MAT_INFRA[_MATURITY_IDX[maturity]])
+            smart_dev = int(_SIZE_DEV[_SIZE_IDX[org_size]])
             
             st.session_state.smart_defaults = {
                 'requests_per_day': smart_requests,
@@ -580,15 +897,13 @@ with tab2:
             st.info(f"📊 {smart_requests:,} requests/day, {smart_tokens:,} tokens, ${smart_cost_per_m}/M")
     
     with col2:
-        if st.button("📚 Estimation Guide", key="estimation_guide_btn"):
-            st.session_state.show_guide = not st.session_state.get('show_guide', False)
+        show_guide = st.toggle("📚 Estimation Guide", key="show_guide")
     
     with col3:
-        if st.button("💰 Cost Ranges", key="cost_ranges_btn"):
-            st.session_state.show_ranges = not st.session_state.get('show_ranges', False)
+        show_ranges = st.toggle("💰 Cost Ranges", key="show_ranges")
     
     # Estimation Guide
-    if st.session_state.get('show_guide', False):
+    if show_guide:
         with st.expander("📚 How to Estimate Costs", expanded=True):
             st.markdown("### Quick Guide to Gen AI Cost Estimation")
             
@@ -623,35 +938,21 @@ with tab2:
             st.markdown("**Salaries:** ML Engineer $140K-$180K, Backend $120K-$160K")
     
     # Cost Ranges
-    if st.session_state.get('show_ranges', False):
+    if show_ranges:
         with st.expander("💰 Industry Benchmarks", expanded=True):
+            industry_df, maturity_df, case_df = _benchmark_tables()
             tabs = st.tabs(["By Industry", "By Maturity", "By Use Case"])
             
             with tabs[0]:
                 st.markdown("### Industry Cost Factors")
-                industry_df = pd.DataFrame({
-                    'Industry': ['Financial', 'Healthcare', 'Tech', 'Retail'],
-                    'Security Factor': ['1.4x', '1.5x', '1.1x', '1.2x'],
-                    'Requirements': ['SOC2, PCI', 'HIPAA', 'Standard', 'PCI']
-                })
                 st.dataframe(industry_df, hide_index=True)
             
             with tabs[1]:
                 st.markdown("### Costs by Maturity")
-                maturity_df = pd.DataFrame({
-                    'Stage': ['Exploring', 'Pilot', 'Scaling', 'Mature'],
-                    'Infrastructure': ['$500-$2K/mo', '$2K-$8K/mo', '$8K-$25K/mo', '$25K-$100K/mo'],
-                    'Development': ['$150K-$400K', '$400K-$800K', '$800K-$2M', '$2M-$5M']
-                })
                 st.dataframe(maturity_df, hide_index=True)
             
             with tabs[2]:
                 st.markdown("### Cost Patterns by Use Case")
-                case_df = pd.DataFrame({
-                    'Use Case': ['Customer Service', 'Content', 'Code', 'Documents'],
-                    'Req/User/Day': ['20-50', '5-15', '15-40', '5-20'],
-                    'Tokens': ['1.5K-2.5K', '3K-6K', '2K-4K', '4K-8K']
-                })
                 st.dataframe(case_df, hide_index=True)
     
     # API Calculator
@@ -659,13 +960,13 @@ with tab2:
         calc_col1, calc_col2 = st.columns(2)
         
         with calc_col1:
-            calc_users = st.number_input("Users:", 1, 100000, 100, key="cu")
-            calc_req = st.number_input("Req/user/day:", 1, 200, 20, key="cr")
-            calc_tokens = st.number_input("Tokens/req:", 100, 20000, 1500, key="ct")
+            calc_users = st.number_input("Users:", 1, 100000, key="cu")
+            calc_req = st.number_input("Req/user/day:", 1, 200, key="cr")
+            calc_tokens = st.number_input("Tokens/req:", 100, 20000, key="ct")
         
         with calc_col2:
-            calc_cost = st.number_input("$/M tokens:", 1.0, 100.0, 15.0, key="cc")
-            calc_growth = st.number_input("Growth %:", 0, 200, 25, key="cg")
+            calc_cost = st.number_input("$/M tokens:", 1.0, 100.0, key="cc")
+            calc_growth = st.number_input("Growth %:", 0, 200, key="cg")
         
         daily_req = calc_users * calc_req
         monthly_cost = (daily_req * 30 * calc_tokens / 1000000) * calc_cost
@@ -676,236 +977,142 @@ with tab2:
         st.markdown("### Results")
         c1, c2, c3, c4 = st.columns(4)
         c1.metric("Daily Req", f"{daily_req:,}")
-        c2.metric("Monthly", f"${monthly_cost:,.0f}")
-        c3.metric("Year 1", f"${year1:,.0f}")
-        c4.metric("3-Year", f"${(year1+year2+year3):,.0f}")
+        c2.metric("Monthly", _USD(monthly_cost))
+        c3.metric("Year 1", _USD(year1))
+        c4.metric("3-Year", _USD(year1+year2+year3))
     
     st.markdown("---")
     
 
-    # 1. Direct AI Costs
-    st.subheader("💳 1. Direct AI Model Costs")
+    # Sections 1-7 are one form, so editing a field doesn't rerun the page;
+    # the widgets report their submitted values until "Calculate TCO" is pressed
+    with st.form("cost_inputs", clear_on_submit=False, border=False):
+        # 1. Direct AI Costs
+        st.subheader("💳 1. Direct AI Model Costs")
     
-    col1, col2 = st.columns(2)
+        col1, col2 = st.columns(2)
     
-    with col1:
-        model_provider = st.selectbox("Primary Model Provider", 
-            ["OpenAI (GPT-4, GPT-3.5)", "Anthropic (Claude)", "AWS Bedrock", "Azure OpenAI", "Google Vertex AI", "Multiple Providers"],
-            index=["OpenAI (GPT-4, GPT-3.5)", "Anthropic (Claude)", "AWS Bedrock", "Azure OpenAI", "Google Vertex AI", "Multiple Providers"].index(
-                get_demo_value('ai_costs', 'model_provider', 'Anthropic (Claude)')))
+        with col1:
+            model_provider = st.selectbox("Primary Model Provider", 
+                ["OpenAI (GPT-4, GPT-3.5)", "Anthropic (Claude)", "AWS Bedrock", "Azure OpenAI", "Google Vertex AI", "Multiple Providers"],
+                key='model_provider')
         
-        avg_tokens_per_request = st.number_input("Avg Tokens per Request (Input + Output)", 
-            min_value=100, 
-            value=int(get_demo_value('ai_costs', 'avg_tokens_per_request', 2000)), 
-            help="Typical range: 500-5000 tokens")
+            avg_tokens_per_request = st.number_input("Avg Tokens per Request (Input + Output)", 
+                min_value=100, 
+                help="Typical range: 500-5000 tokens", key='avg_tokens_per_request')
         
-        requests_per_day = st.number_input("Estimated Requests per Day", 
-            min_value=1, 
-            value=int(get_demo_value('ai_costs', 'requests_per_day', 1000)), 
-            help="Total across all users")
+            requests_per_day = st.number_input("Estimated Requests per Day", 
+                min_value=1, 
+                help="Total across all users", key='requests_per_day')
     
-    with col2:
-        cost_per_million_tokens = st.number_input("Cost per Million Tokens (USD)", 
-            min_value=0.0, 
-            value=float(get_demo_value('ai_costs', 'cost_per_million_tokens', 15.0)), 
-            step=0.5, 
-            help="GPT-4: ~$30, GPT-3.5: ~$2, Claude Sonnet: ~$15")
+        with col2:
+            cost_per_million_tokens = st.number_input("Cost per Million Tokens (USD)", 
+                min_value=0.0, 
+                step=0.5, 
+                help="GPT-4: ~$30, GPT-3.5: ~$2, Claude Sonnet: ~$15", key='cost_per_million_tokens')
         
-        growth_rate = st.slider("Expected Annual Usage Growth (%)", 
-            min_value=0, max_value=200, 
-            value=int(get_demo_value('ai_costs', 'growth_rate', 50)), 
-            help="How fast will usage grow?")
+            growth_rate = st.slider("Expected Annual Usage Growth (%)", 
+                min_value=0, max_value=200, 
+                help="How fast will usage grow?", key='growth_rate')
         
-        embedding_cost = st.number_input("Monthly Embedding/Vector DB Cost (USD)", 
-            min_value=0, 
-            value=int(get_demo_value('ai_costs', 'embedding_cost', 500)), 
-            help="Pinecone, Weaviate, etc.")
+            embedding_cost = st.number_input("Monthly Embedding/Vector DB Cost (USD)", 
+                min_value=0, 
+                help="Pinecone, Weaviate, etc.", key='embedding_cost')
     
-    # Calculate direct costs
-    annual_requests = requests_per_day * 365
-    total_tokens = annual_requests * avg_tokens_per_request
-    year1_api_cost = (total_tokens / 1_000_000) * cost_per_million_tokens
-    year2_api_cost = year1_api_cost * (1 + growth_rate/100)
-    year3_api_cost = year2_api_cost * (1 + growth_rate/100)
+        # Calculate direct costs
+        api_costs = compute_api_costs(requests_per_day, avg_tokens_per_request,
+                                      cost_per_million_tokens, embedding_cost)
+        year1_api_cost = api_costs['year1_api']
     
-    year1_embedding = embedding_cost * 12
-    year2_embedding = year1_embedding * (1 + growth_rate/100)
-    year3_embedding = year2_embedding * (1 + growth_rate/100)
+        st.info(f"📊 **Year 1 API Cost Estimate:** ${year1_api_cost:,.2f}")
     
-    st.info(f"📊 **Year 1 API Cost Estimate:** ${year1_api_cost:,.2f}")
+        st.markdown("---")
     
-    st.markdown("---")
+        # 2. Infrastructure Costs
+        st.subheader("🖥️ 2. Infrastructure & Cloud Costs")
     
-    # 2. Infrastructure Costs
-    st.subheader("🖥️ 2. Infrastructure & Cloud Costs")
+        _line_item_editor(_INFRA_ROWS, _INFRA_COLS, 'infra_editor')
     
-    col1, col2 = st.columns(2)
+        st.markdown("---")
     
-    with col1:
-        compute_cost = st.number_input("Monthly Compute Resources (EC2, Lambda, etc.)", 
-            min_value=0, value=2000, help="Development, staging, production environments")
-        
-        storage_cost = st.number_input("Monthly Storage (S3, databases, logs)", 
-            min_value=0, value=500)
-        
-        networking_cost = st.number_input("Monthly Networking (Data transfer, VPC)", 
-            min_value=0, value=300)
+        # 3. Development & Engineering Costs
+        st.subheader("👥 3. Development & Engineering Team")
     
-    with col2:
-        security_tools = st.number_input("Monthly Security & Compliance Tools", 
-            min_value=0, value=1000, help="WAF, GuardDuty, Security Hub, etc.")
-        
-        monitoring_tools = st.number_input("Monthly Monitoring & Observability", 
-            min_value=0, value=800, help="CloudWatch, DataDog, New Relic, etc.")
-        
-        backup_dr = st.number_input("Monthly Backup & Disaster Recovery", 
-            min_value=0, value=400)
+        _line_item_editor(_DEV_ROWS, _DEV_COLS, 'dev_team_editor')
     
-    monthly_infra = compute_cost + storage_cost + networking_cost + security_tools + monitoring_tools + backup_dr
-    year1_infra = monthly_infra * 12
-    year2_infra = year1_infra * 1.15  # 15% annual increase
-    year3_infra = year2_infra * 1.15
+        dev_tools = st.number_input("Annual Development Tools & Licenses", 
+            min_value=0, help="IDEs, testing frameworks, CI/CD, etc.", key='dev_tools')
     
-    st.markdown("---")
+        st.markdown("---")
     
-    # 3. Development & Engineering Costs
-    st.subheader("👥 3. Development & Engineering Team")
+        # 4. Data Management Costs
+        st.subheader("📊 4. Data Management & Preparation")
     
-    col1, col2 = st.columns(2)
+        col1, col2 = st.columns(2)
     
-    with col1:
-        ai_engineers = st.number_input("AI/ML Engineers (FTE)", min_value=0.0, value=2.0, step=0.5)
-        ai_engineer_cost = st.number_input("Annual Cost per AI Engineer (USD)", 
-            min_value=0, value=180000, help="Salary + benefits + overhead")
+        with col1:
+            data_engineers = st.number_input("Data Engineers (FTE)", min_value=0.0, step=0.5, key='data_engineers')
+            data_engineer_cost = st.number_input("Annual Cost per Data Engineer", 
+                min_value=0, key='data_engineer_cost')
         
-        backend_devs = st.number_input("Backend Developers (FTE)", min_value=0.0, value=2.0, step=0.5)
-        backend_cost = st.number_input("Annual Cost per Backend Dev (USD)", 
-            min_value=0, value=150000)
+            data_prep_cost = st.number_input("Annual Data Preparation/Cleaning", 
+                min_value=0, help="Tools, services, manual effort", key='data_prep_cost')
     
-    with col2:
-        frontend_devs = st.number_input("Frontend Developers (FTE)", min_value=0.0, value=1.0, step=0.5)
-        frontend_cost = st.number_input("Annual Cost per Frontend Dev (USD)", 
-            min_value=0, value=130000)
+        with col2:
+            data_quality_tools = st.number_input("Annual Data Quality & Governance Tools", 
+                min_value=0, help="Data catalogs, quality monitoring", key='data_quality_tools')
         
-        qa_engineers = st.number_input("QA/Test Engineers (FTE)", min_value=0.0, value=1.0, step=0.5)
-        qa_cost = st.number_input("Annual Cost per QA Engineer (USD)", 
-            min_value=0, value=120000)
+            data_labeling = st.number_input("Annual Data Labeling/Annotation", 
+                min_value=0, help="If fine-tuning or custom training needed", key='data_labeling')
     
-    dev_tools = st.number_input("Annual Development Tools & Licenses", 
-        min_value=0, value=50000, help="IDEs, testing frameworks, CI/CD, etc.")
-    
-    year1_dev = (ai_engineers * ai_engineer_cost + backend_devs * backend_cost + 
-                 frontend_devs * frontend_cost + qa_engineers * qa_cost + dev_tools)
-    year2_dev = year1_dev * 1.05  # 5% annual increase
-    year3_dev = year2_dev * 1.05
-    
-    st.markdown("---")
-    
-    # 4. Data Management Costs
-    st.subheader("📊 4. Data Management & Preparation")
+        st.markdown("---")
     
-    col1, col2 = st.columns(2)
+        # 5. Operations & Maintenance
+        st.subheader("⚙️ 5. Operations & Maintenance")
     
-    with col1:
-        data_engineers = st.number_input("Data Engineers (FTE)", min_value=0.0, value=1.0, step=0.5)
-        data_engineer_cost = st.number_input("Annual Cost per Data Engineer", 
-            min_value=0, value=160000)
-        
-        data_prep_cost = st.number_input("Annual Data Preparation/Cleaning", 
-            min_value=0, value=50000, help="Tools, services, manual effort")
+        col1, col2 = st.columns(2)
     
-    with col2:
-        data_quality_tools = st.number_input("Annual Data Quality & Governance Tools", 
-            min_value=0, value=30000, help="Data catalogs, quality monitoring")
+        with col1:
+            ops_engineers = st.number_input("DevOps/SRE Engineers (FTE)", min_value=0.0, step=0.5, key='ops_engineers')
+            ops_cost = st.number_input("Annual Cost per Ops Engineer", min_value=0, key='ops_cost')
         
-        data_labeling = st.number_input("Annual Data Labeling/Annotation", 
-            min_value=0, value=40000, help="If fine-tuning or custom training needed")
-    
-    year1_data = (data_engineers * data_engineer_cost + data_prep_cost + 
-                  data_quality_tools + data_labeling)
-    year2_data = year1_data * 1.1  # 10% increase
-    year3_data = year2_data * 1.1
-    
-    st.markdown("---")
-    
-    # 5. Operations & Maintenance
-    st.subheader("⚙️ 5. Operations & Maintenance")
+            support_staff = st.number_input("Support Staff (FTE)", min_value=0.0, step=0.5, key='support_staff')
+            support_cost = st.number_input("Annual Cost per Support Staff", min_value=0, key='support_cost')
     
-    col1, col2 = st.columns(2)
-    
-    with col1:
-        ops_engineers = st.number_input("DevOps/SRE Engineers (FTE)", min_value=0.0, value=1.0, step=0.5)
-        ops_cost = st.number_input("Annual Cost per Ops Engineer", min_value=0, value=170000)
+        with col2:
+            incident_mgmt = st.number_input("Annual Incident Management & On-call", 
+                min_value=0, key='incident_mgmt')
         
-        support_staff = st.number_input("Support Staff (FTE)", min_value=0.0, value=1.0, step=0.5)
-        support_cost = st.number_input("Annual Cost per Support Staff", min_value=0, value=100000)
+            model_retraining = st.number_input("Annual Model Retraining/Fine-tuning", 
+                min_value=0, help="Compute, data, engineering time", key='model_retraining')
     
-    with col2:
-        incident_mgmt = st.number_input("Annual Incident Management & On-call", 
-            min_value=0, value=30000)
-        
-        model_retraining = st.number_input("Annual Model Retraining/Fine-tuning", 
-            min_value=0, value=50000, help="Compute, data, engineering time")
+        st.markdown("---")
     
-    year1_ops = (ops_engineers * ops_cost + support_staff * support_cost + 
-                 incident_mgmt + model_retraining)
-    year2_ops = year1_ops * 1.08
-    year3_ops = year2_ops * 1.08
+        # 6. Organizational Costs
+        st.subheader("🏛️ 6. Organizational & Change Management")
     
-    st.markdown("---")
+        _line_item_editor(_ORG_ROWS, _ORG_COLS, 'org_editor')
     
-    # 6. Organizational Costs
-    st.subheader("🏛️ 6. Organizational & Change Management")
+        st.markdown("---")
     
-    col1, col2 = st.columns(2)
+        # 7. Risk & Contingency
+        st.subheader("⚠️ 7. Risk & Contingency Buffer")
     
-    with col1:
-        training_cost = st.number_input("Annual User Training Programs", 
-            min_value=0, value=50000, help="Training materials, sessions, platforms")
-        
-        change_mgmt = st.number_input("Change Management Investment", 
-            min_value=0, value=75000, help="Communication, adoption programs")
+        contingency_pct = st.slider("Contingency Reserve (%)", 
+            min_value=0, max_value=50, 
+            help="Buffer for unexpected costs, model failures, vendor changes", key='contingency_pct')
     
-    with col2:
-        governance_cost = st.number_input("Annual Governance & Compliance", 
-            min_value=0, value=60000, help="Policies, audits, risk management")
+        vendor_lock_in = st.radio("Vendor Lock-in Mitigation Strategy?", 
+            ["No strategy (High Risk)", "Basic (Multi-provider testing)", "Advanced (Abstraction layer)"], key='vendor_lock_in')
         
-        legal_cost = st.number_input("Annual Legal & IP Review", 
-            min_value=0, value=40000, help="Contract review, IP protection")
-    
-    year1_org = training_cost + change_mgmt + governance_cost + legal_cost
-    year2_org = year1_org * 0.7  # Typically decreases after first year
-    year3_org = year2_org * 0.8
-    
-    st.markdown("---")
-    
-    # 7. Risk & Contingency
-    st.subheader("⚠️ 7. Risk & Contingency Buffer")
-    
-    contingency_pct = st.slider("Contingency Reserve (%)", 
-        min_value=0, max_value=50, value=15, 
-        help="Buffer for unexpected costs, model failures, vendor changes")
-    
-    vendor_lock_in = st.radio("Vendor Lock-in Mitigation Strategy?", 
-        ["No strategy (High Risk)", "Basic (Multi-provider testing)", "Advanced (Abstraction layer)"])
-    
-    # Calculate total costs
-    year1_subtotal = (year1_api_cost + year1_embedding + year1_infra + year1_dev + 
-                      year1_data + year1_ops + year1_org)
-    year1_contingency = year1_subtotal * (contingency_pct / 100)
-    year1_total = year1_subtotal + year1_contingency
-    
-    year2_subtotal = (year2_api_cost + year2_embedding + year2_infra + year2_dev + 
-                      year2_data + year2_ops + year2_org)
-    year2_contingency = year2_subtotal * (contingency_pct / 100)
-    year2_total = year2_subtotal + year2_contingency
+        st.form_submit_button("Calculate TCO", type="primary")
     
-    year3_subtotal = (year3_api_cost + year3_embedding + year3_infra + year3_dev + 
-                      year3_data + year3_ops + year3_org)
-    year3_contingency = year3_subtotal * (contingency_pct / 100)
-    year3_total = year3_subtotal + year3_contingency
-    
-    three_year_tco = year1_total + year2_total + year3_total
+    # Calculate total costs - only when the inputs differ from the last stored result
+    cost_key = _cost_key(st.session_state)
+    stored_cost_data = st.session_state.setdefault('cost_data', {})
+    if st.session_state.get('_last_cost_key') != cost_key or 'three_year_tco' not in stored_cost_data:
+        stored_cost_data.update(compute_cost_data(*cost_key))
+        st.session_state._last_cost_key = cost_key
     
     # Validate inputs
     try:
@@ -928,42 +1135,27 @@ with tab2:
     except Exception as e:
         pass  # Validation is optional
     
-    # Store in session state
-    st.session_state.cost_data = {
-        'year1_total': year1_total,
-        'year2_total': year2_total,
-        'year3_total': year3_total,
-        'three_year_tco': three_year_tco,
-        'year1_breakdown': {
-            'API Costs': year1_api_cost + year1_embedding,
-            'Infrastructure': year1_infra,
-            'Development': year1_dev,
-            'Data Management': year1_data,
-            'Operations': year1_ops,
-            'Organizational': year1_org,
-            'Contingency': year1_contingency
-        },
-        'org_name': org_name,
-        'industry': industry,
-        'use_case': use_case
-    }
+    # Store the profile alongside the totals in the persistent dict
+    stored_cost_data.update(org_name=org_name, industry=industry, use_case=use_case)
     
     st.success("✅ Cost analysis completed! Switch to the ROI Calculator tab to continue.")
 
 
-# Tab 3: ROI Calculator Section
-with tab3:
+# Tab 3: ROI Calculator Section - a fragment, so its own widgets only rerun this tab
+@st.fragment
+def _roi_tab(expected_users):
     st.header("Return on Investment Analysis")
     
     if 'cost_data' not in st.session_state:
         st.warning("⚠️ Please complete the Cost Analysis tab first.")
     else:
-        st.markdown("""
-        <div class="info-box">
-        <strong>ROI Calculation:</strong> Estimate the business value and benefits from your Gen AI implementation.
-        Be realistic and conservative in your estimates.
-        </div>
-        """, unsafe_allow_html=True)
+        st.info("**ROI Calculation:** Estimate the business value and benefits from your Gen AI implementation. "
+                "Be realistic and conservative in your estimates.")
+        
+        # Affected users default to the expected users; reset it when that estimate changes
+        if st.session_state.get('_affected_users_default') != expected_users:
+            st.session_state.affected_users = expected_users
+            st.session_state._affected_users_default = expected_users
         
         # Benefits Categories
         st.subheader("💰 Quantifiable Benefits")
@@ -974,32 +1166,32 @@ with tab3:
             st.markdown("**Productivity & Efficiency Gains**")
             
             time_saved_per_user = st.number_input("Avg Hours Saved per User per Week", 
-                min_value=0.0, value=5.0, step=0.5)
+                min_value=0.0, step=0.5, key='time_saved_per_user')
             
             hourly_rate = st.number_input("Avg Hourly Rate (USD)", 
-                min_value=0, value=75, help="Blended rate for affected users")
+                min_value=0, help="Blended rate for affected users", key='hourly_rate')
             
             affected_users = st.number_input("Number of Affected Users", 
-                min_value=1, value=expected_users if 'expected_users' in locals() else 100)
+                min_value=1, key='affected_users')
             
             productivity_pct = st.slider("Productivity Gain Confidence (%)", 
-                min_value=0, max_value=100, value=70, 
-                help="How confident are you in achieving these gains?")
+                min_value=0, max_value=100, 
+                help="How confident are you in achieving these gains?", key='productivity_pct')
         
         with col2:
             st.markdown("**Cost Reduction & Avoidance**")
             
             customer_service_reduction = st.number_input("Annual Customer Service Cost Reduction (USD)", 
-                min_value=0, value=100000, help="Reduced support staff, faster resolution")
+                min_value=0, help="Reduced support staff, faster resolution", key='customer_service_reduction')
             
             process_automation_value = st.number_input("Annual Process Automation Value (USD)", 
-                min_value=0, value=150000, help="Manual processes automated")
+                min_value=0, help="Manual processes automated", key='process_automation_value')
             
             error_reduction_value = st.number_input("Annual Error Reduction Value (USD)", 
-                min_value=0, value=50000, help="Fewer mistakes, rework")
+                min_value=0, help="Fewer mistakes, rework", key='error_reduction_value')
             
             cost_reduction_confidence = st.slider("Cost Reduction Confidence (%)", 
-                min_value=0, max_value=100, value=60)
+                min_value=0, max_value=100, key='cost_reduction_confidence')
         
         st.markdown("---")
         
@@ -1009,106 +1201,72 @@ with tab3:
             st.markdown("**Revenue Generation**")
             
             new_revenue = st.number_input("Annual New Revenue from AI Features (USD)", 
-                min_value=0, value=200000, help="New product features, services")
+                min_value=0, help="New product features, services", key='new_revenue')
             
             customer_retention = st.number_input("Annual Value from Improved Retention (USD)", 
-                min_value=0, value=100000, help="Reduced churn, better experience")
+                min_value=0, help="Reduced churn, better experience", key='customer_retention')
             
             revenue_confidence = st.slider("Revenue Confidence (%)", 
-                min_value=0, max_value=100, value=50, 
-                help="New revenue is harder to predict")
+                min_value=0, max_value=100, 
+                help="New revenue is harder to predict", key='revenue_confidence')
         
         with col2:
             st.markdown("**Strategic Benefits**")
             
             competitive_advantage = st.number_input("Annual Competitive Advantage Value (USD)", 
-                min_value=0, value=150000, help="Market positioning, faster time-to-market")
+                min_value=0, help="Market positioning, faster time-to-market", key='competitive_advantage')
             
             innovation_value = st.number_input("Annual Innovation Acceleration Value (USD)", 
-                min_value=0, value=100000, help="Faster experimentation, prototyping")
+                min_value=0, help="Faster experimentation, prototyping", key='innovation_value')
             
             strategic_confidence = st.slider("Strategic Benefits Confidence (%)", 
-                min_value=0, max_value=100, value=50)
-        
-        # Calculate benefits with confidence adjustments
-        annual_time_saved = time_saved_per_user * affected_users * 52  # weeks per year
-        productivity_value_year1 = annual_time_saved * hourly_rate * (productivity_pct / 100)
-        productivity_value_year2 = productivity_value_year1 * 1.2  # Improvement over time
-        productivity_value_year3 = productivity_value_year2 * 1.15
-        
-        cost_reduction_year1 = (customer_service_reduction + process_automation_value + 
-                                error_reduction_value) * (cost_reduction_confidence / 100)
-        cost_reduction_year2 = cost_reduction_year1 * 1.3  # Scaling benefits
-        cost_reduction_year3 = cost_reduction_year2 * 1.2
-        
-        revenue_year1 = (new_revenue + customer_retention) * (revenue_confidence / 100)
-        revenue_year2 = revenue_year1 * 1.5  # Growth trajectory
-        revenue_year3 = revenue_year2 * 1.4
-        
-        strategic_year1 = (competitive_advantage + innovation_value) * (strategic_confidence / 100)
-        strategic_year2 = strategic_year1 * 1.2
-        strategic_year3 = strategic_year2 * 1.15
+                min_value=0, max_value=100, key='strategic_confidence')
         
-        year1_benefits = productivity_value_year1 + cost_reduction_year1 + revenue_year1 + strategic_year1
-        year2_benefits = productivity_value_year2 + cost_reduction_year2 + revenue_year2 + strategic_year2
-        year3_benefits = productivity_value_year3 + cost_reduction_year3 + revenue_year3 + strategic_year3
-        
-        three_year_benefits = year1_benefits + year2_benefits + year3_benefits
-        
-        # Calculate ROI
+        # Calculate benefits, ROI and payback - reusing the stored result when
+        # neither the cost totals nor the ROI inputs changed since the last run
         cost_data = st.session_state.cost_data
-        three_year_tco = cost_data['three_year_tco']
-        
-        net_benefit = three_year_benefits - three_year_tco
-        roi_percentage = ((three_year_benefits - three_year_tco) / three_year_tco) * 100 if three_year_tco > 0 else 0
-        
-        # Calculate payback period
-        cumulative_benefit = 0
-        cumulative_cost = 0
-        payback_months = 0
-        monthly_benefits = [year1_benefits/12] * 12 + [year2_benefits/12] * 12 + [year3_benefits/12] * 12
-        monthly_costs = [cost_data['year1_total']/12] * 12 + [cost_data['year2_total']/12] * 12 + [cost_data['year3_total']/12] * 12
+        roi_key = ((cost_data['year1_total'], cost_data['year2_total'], cost_data['year3_total'],
+                    cost_data['three_year_tco']),
+                   (time_saved_per_user, hourly_rate, affected_users, productivity_pct,
+                    customer_service_reduction, process_automation_value, error_reduction_value,
+                    cost_reduction_confidence, new_revenue, customer_retention, revenue_confidence,
+                    competitive_advantage, innovation_value, strategic_confidence))
+        if (st.session_state.get('_last_roi_key') == roi_key and
+                'year1_benefits' in st.session_state.get('roi_data', {})):
+            roi_data = st.session_state.roi_data
+        else:
+            roi_data = compute_roi_data(*roi_key)
+            st.session_state._last_roi_key = roi_key
         
-        for month in range(36):
-            cumulative_benefit += monthly_benefits[month]
-            cumulative_cost += monthly_costs[month]
-            if cumulative_benefit >= cumulative_cost:
-                payback_months = month + 1
-                break
-        
-        if payback_months == 0:
-            payback_months = "36+"
+        three_year_tco = cost_data['three_year_tco']
+        year1_benefits = roi_data['year1_benefits']
+        year2_benefits = roi_data['year2_benefits']
+        year3_benefits = roi_data['year3_benefits']
+        three_year_benefits = roi_data['three_year_benefits']
+        net_benefit = roi_data['net_benefit']
+        roi_percentage = roi_data['roi_percentage']
+        payback_months = roi_data['payback_months']
+        # Charts are skipped until both sides have something to plot; the caption
+        # names whichever side is still missing
+        missing = [side for side, total in (("cost estimates in Cost Analysis", three_year_tco),
+                                            ("benefit estimates above", three_year_benefits))
+                   if total <= 0]
+        charts_hint = f"Enter {' and '.join(missing)} to see charts." if missing else None
         
         # Store ROI data
-        st.session_state.roi_data = {
-            'year1_benefits': year1_benefits,
-            'year2_benefits': year2_benefits,
-            'year3_benefits': year3_benefits,
-            'three_year_benefits': three_year_benefits,
-            'net_benefit': net_benefit,
-            'roi_percentage': roi_percentage,
-            'payback_months': payback_months
-        }
+        st.session_state.roi_data = roi_data
         
         # Display Results
         st.markdown("---")
         st.subheader("📊 ROI Summary")
         
         col1, col2, col3, col4 = st.columns(4)
-        
-        with col1:
-            st.metric("3-Year Total Cost", f"${three_year_tco:,.0f}")
-        
-        with col2:
-            st.metric("3-Year Total Benefits", f"${three_year_benefits:,.0f}")
-        
-        with col3:
-            st.metric("Net Benefit", f"${net_benefit:,.0f}", 
-                     delta="Positive" if net_benefit > 0 else "Negative")
-        
-        with col4:
-            st.metric("ROI", f"{roi_percentage:.1f}%",
-                     delta="Good" if roi_percentage > 100 else "Review")
+        col1.metric("3-Year Total Cost", _USD(three_year_tco))
+        col2.metric("3-Year Total Benefits", _USD(three_year_benefits))
+        col3.metric("Net Benefit", _USD(net_benefit), 
+                    delta="Positive" if net_benefit > 0 else "Negative")
+        col4.metric("ROI", _PCT(roi_percentage),
+                    delta="Good" if roi_percentage > 100 else "Review")
         
         st.markdown("---")
         
@@ -1118,107 +1276,60 @@ with tab3:
         with col1:
             st.metric("Payback Period", f"{payback_months} months")
             
-            if isinstance(payback_months, int):
-                if payback_months <= 12:
-                    st.success("✅ Excellent payback period")
-                elif payback_months <= 24:
-                    st.info("ℹ️ Good payback period")
-                else:
-                    st.warning("⚠️ Long payback period - review assumptions")
-            else:
-                st.error("❌ Payback beyond 3 years - significant risk")
+            bucket = int(np.digitize(payback_months, _PAYBACK_BINS)) if isinstance(payback_months, int) else 3
+            show_status, message = _PAYBACK_STATUS[bucket]
+            show_status(message)
         
         with col2:
             # Year by year comparison
-            comparison_data = pd.DataFrame({
-                'Year': ['Year 1', 'Year 2', 'Year 3'],
-                'Costs': [cost_data['year1_total'], cost_data['year2_total'], cost_data['year3_total']],
-                'Benefits': [year1_benefits, year2_benefits, year3_benefits],
-                'Net': [year1_benefits - cost_data['year1_total'], 
-                       year2_benefits - cost_data['year2_total'],
-                       year3_benefits - cost_data['year3_total']]
-            })
-            
-            fig = go.Figure()
-            fig.add_trace(go.Bar(name='Costs', x=comparison_data['Year'], 
-                                y=comparison_data['Costs'], marker_color='#ff7f0e'))
-            fig.add_trace(go.Bar(name='Benefits', x=comparison_data['Year'], 
-                                y=comparison_data['Benefits'], marker_color='#2ca02c'))
-            fig.update_layout(title="Annual Costs vs Benefits", barmode='group', height=300)
-            st.plotly_chart(fig, use_container_width=True)
+            if charts_hint is None:
+                fig = _build_comparison_fig(
+                    (cost_data['year1_total'], cost_data['year2_total'], cost_data['year3_total']),
+                    (year1_benefits, year2_benefits, year3_benefits))
+                st.plotly_chart(fig, width="stretch", theme=None, key="cost_vs_benefit_chart")
+            else:
+                st.caption(charts_hint)
         
         st.markdown("---")
         
         # Sensitivity Analysis
         st.subheader("🎯 Sensitivity Analysis")
         
-        st.markdown("""
-        <div class="warning-box">
-        <strong>Risk Consideration:</strong> ROI projections are sensitive to assumptions. 
-        Review how changes in key variables affect outcomes.
-        </div>
-        """, unsafe_allow_html=True)
+        st.warning("**Risk Consideration:** ROI projections are sensitive to assumptions. "
+                   "Review how changes in key variables affect outcomes.")
         
         col1, col2 = st.columns(2)
         
         with col1:
-            benefit_scenarios = {
-                'Pessimistic (70% of estimate)': 0.7,
-                'Base Case (100%)': 1.0,
-                'Optimistic (130% of estimate)': 1.3
-            }
-            
-            scenario_results = []
-            for scenario, multiplier in benefit_scenarios.items():
-                adjusted_benefits = three_year_benefits * multiplier
-                adjusted_roi = ((adjusted_benefits - three_year_tco) / three_year_tco) * 100
-                scenario_results.append({
-                    'Scenario': scenario,
-                    'ROI': adjusted_roi,
-                    'Net Benefit': adjusted_benefits - three_year_tco
-                })
-            
-            scenario_df = pd.DataFrame(scenario_results)
-            
-            fig = go.Figure()
-            fig.add_trace(go.Bar(x=scenario_df['Scenario'], y=scenario_df['ROI'],
-                                marker_color=['#ff7f0e', '#1f77b4', '#2ca02c']))
-            fig.update_layout(title="ROI Under Different Scenarios", 
-                            yaxis_title="ROI %", height=300)
-            st.plotly_chart(fig, use_container_width=True)
+            if charts_hint is None:
+                # All scenarios in one pass over the multiplier vector
+                adjusted_net = three_year_benefits * _SCENARIO_MULTIPLIERS - three_year_tco
+                adjusted_roi = adjusted_net * (100.0 / three_year_tco)
+                
+                fig = _build_scenario_fig(_SCENARIOS, tuple(adjusted_roi.tolist()))
+                st.plotly_chart(fig, width="stretch", theme=None, key="scenario_roi_chart")
+            else:
+                st.caption(charts_hint)
         
         with col2:
             st.markdown("**Key Risk Factors:**")
-            
-            risk_factors = {
-                "Adoption slower than expected": "High",
-                "Benefits take longer to realize": "Medium",
-                "Costs higher than estimated": "Medium",
-                "Model performance degrades": "Medium",
-                "Regulatory changes": "Low-Medium",
-                "Vendor pricing changes": "Medium"
-            }
-            
-            for risk, severity in risk_factors.items():
-                color = "#dc3545" if severity == "High" else "#ffc107" if severity == "Medium" else "#28a745"
-                st.markdown(f"<div style='background-color:{color}20; padding:8px; border-radius:4px; margin:5px 0;'>"
-                          f"<strong>{risk}</strong>: {severity}</div>", unsafe_allow_html=True)
+            st.markdown(_RISK_FACTOR_CARDS, unsafe_allow_html=True)
         
         st.session_state.calculation_done = True
         st.success("✅ ROI analysis completed! Check out the Risk Assessment or Summary Report tabs.")
 
+if section == "📈 ROI Calculator":
+    _roi_tab(st.session_state.get('expected_users', 100))
 
-# Tab 4: Risk Assessment Section
-with tab4:
+
+# Tab 4: Risk Assessment Section - a fragment, so its own widgets only rerun this tab
+@st.fragment
+def _risk_tab():
     st.header("Comprehensive Risk Assessment")
     
-    st.markdown("""
-    <div class="info-box">
-    Choose your preferred method:<br>
-    <strong>🤖 AI-Powered Assessment:</strong> Automatically analyze risks based on your inputs (recommended)<br>
-    <strong>📝 Manual Assessment:</strong> Rate each risk yourself for granular control
-    </div>
-    """, unsafe_allow_html=True)
+    st.info("Choose your preferred method:  \n"
+            "**🤖 AI-Powered Assessment:** Automatically analyze risks based on your inputs (recommended)  \n"
+            "**📝 Manual Assessment:** Rate each risk yourself for granular control")
     
     # Check if cost data is available
     if 'cost_data' not in st.session_state:
@@ -1291,41 +1402,41 @@ with tab4:
             st.subheader("🎯 Top Priority Risks")
             top_risks = summary.get('top_5_risks', [])
             
+            top_risk_cards = []
             for i, risk in enumerate(top_risks, 1):
                 severity = "🔴 Critical" if risk['score'] >= 20 else "🟠 High" if risk['score'] >= 16 else "🟡 Elevated"
-                st.markdown(f"""
+                top_risk_cards.append(f"""
                 <div class="warning-box">
                 <strong>{i}. {severity}: {risk['name']}</strong><br>
                 Risk Score: {risk['score']} (Likelihood: {risk['likelihood']}, Impact: {risk['impact']})
                 </div>
-                """, unsafe_allow_html=True)
+                """)
+            if top_risk_cards:
+                st.markdown("".join(top_risk_cards), unsafe_allow_html=True)
             
             st.markdown("---")
             
             # Detailed Risk Analysis by Category
             st.subheader("📊 Detailed Risk Analysis")
             
-            risk_categories = {
-                "Technical Risks": ai_risks.get('Technical Risks', {}),
-                "Operational Risks": ai_risks.get('Operational Risks', {}),
-                "Business Risks": ai_risks.get('Business Risks', {}),
-                "Compliance & Legal Risks": ai_risks.get('Compliance & Legal Risks', {}),
-                "Security Risks": ai_risks.get('Security Risks', {})
-            }
+            risk_categories = {category: ai_risks.get(category, {}) for category in _RISK_CATEGORY_NAMES}
             
             for category, risks in risk_categories.items():
                 with st.expander(f"**{category}** ({len(risks)} risks assessed)", expanded=False):
+                    risk_cards = []
                     for risk_name, risk_data in risks.items():
                         score = risk_data['likelihood'] * risk_data['impact']
                         severity_color = "#dc3545" if score >= 16 else "#ffc107" if score >= 9 else "#28a745"
                         
-                        st.markdown(f"""
+                        risk_cards.append(f"""
                         <div style='background-color:{severity_color}20; padding:15px; border-radius:8px; margin:10px 0; border-left: 5px solid {severity_color};'>
                         <strong>{risk_name}</strong><br>
                         <small>Likelihood: {risk_data['likelihood']}/5 | Impact: {risk_data['impact']}/5 | Risk Score: {score}/25</small><br>
                         <em>{risk_data['reasoning']}</em>
                         </div>
-                        """, unsafe_allow_html=True)
+                        """)
+                    if risk_cards:
+                        st.markdown("".join(risk_cards), unsafe_allow_html=True)
             
             st.markdown("---")
             
@@ -1333,44 +1444,15 @@ with tab4:
             st.subheader("💡 AI-Generated Recommendations")
             recommendations = summary.get('key_recommendations', [])
             
-            for i, rec in enumerate(recommendations, 1):
-                st.markdown(f"{i}. {rec}")
+            if recommendations:
+                st.markdown("\n".join(f"{i}. {rec}" for i, rec in enumerate(recommendations, 1)))
             
             # Risk Heat Map
             st.subheader("🔥 Risk Heat Map")
             
-            # Prepare data for visualization
-            import pandas as pd
-            import plotly.express as px
-            
-            risk_matrix = []
-            for category, risks in risk_categories.items():
-                for risk_name, risk_data in risks.items():
-                    risk_matrix.append({
-                        'Risk': risk_name[:40] + '...' if len(risk_name) > 40 else risk_name,
-                        'Category': category,
-                        'Likelihood': risk_data['likelihood'],
-                        'Impact': risk_data['impact'],
-                        'Score': risk_data['likelihood'] * risk_data['impact']
-                    })
-            
-            risk_df = pd.DataFrame(risk_matrix)
-            
-            fig = px.scatter(risk_df, x='Likelihood', y='Impact', size='Score', 
-                           color='Category', hover_data=['Risk'],
-                           title="Risk Heat Map (AI-Generated)",
-                           labels={'Likelihood': 'Likelihood →', 'Impact': 'Impact →'},
-                           size_max=30)
-            
-            fig.update_layout(height=500)
-            fig.update_xaxis(range=[0.5, 5.5], dtick=1)
-            fig.update_yaxis(range=[0.5, 5.5], dtick=1)
-            
-            # Add quadrant lines
-            fig.add_hline(y=3, line_dash="dash", line_color="gray", opacity=0.5)
-            fig.add_vline(x=3, line_dash="dash", line_color="gray", opacity=0.5)
-            
-            st.plotly_chart(fig, use_container_width=True)
+            # The figure is built once per distinct risk set and shared across reruns
+            fig = _build_heatmap_fig(json.dumps(risk_categories))
+            st.plotly_chart(fig, width="stretch")
             
             st.session_state.risk_assessment_done = True
             
@@ -1380,208 +1462,106 @@ with tab4:
             if 'ai_risks' not in st.session_state:
                 st.info("💡 **Tip:** Click 'Generate AI-Powered Risk Assessment' above for automated analysis, or proceed with manual assessment below.")
             
-            st.markdown("""
-            <div class="info-box">
-            Rate each risk on two dimensions:<br>
-            <strong>Likelihood:</strong> How likely is this risk to occur? (1=Very Low, 5=Very High)<br>
-            <strong>Impact:</strong> If it occurs, what would be the impact? (1=Very Low, 5=Very High)
-            </div>
-            """, unsafe_allow_html=True)
+            st.info("Rate each risk on two dimensions:  \n"
+                    "**Likelihood:** How likely is this risk to occur? (1=Very Low, 5=Very High)  \n"
+                    "**Impact:** If it occurs, what would be the impact? (1=Very Low, 5=Very High)")
             
-            risk_categories = {
-        "Technical Risks": [
-            ("Model performance degradation over time", "How will you monitor and address model drift?"),
-            ("Integration complexity with existing systems", "Assessment of technical debt and compatibility"),
-            ("Scalability challenges", "Can the solution handle 10x growth?"),
-            ("Data quality and availability issues", "Is your data ready for AI?"),
-            ("Latency and performance issues", "Real-time requirements met?")
-        ],
-        "Operational Risks": [
-            ("Skills gap in team", "Do you have AI/ML expertise in-house?"),
-            ("Change management resistance", "Is the organization ready for change?"),
-            ("Vendor lock-in", "How dependent are you on specific providers?"),
-            ("Support and maintenance burden", "24/7 support requirements?"),
-            ("Shadow IT and uncontrolled usage", "How will you govern usage?")
-        ],
-        "Business Risks": [
-            ("ROI not realized as expected", "What if benefits are overestimated?"),
-            ("Competitive landscape changes", "What if competitors move faster?"),
-            ("Budget constraints", "What if funding is cut?"),
-            ("Stakeholder misalignment", "Are all stakeholders on board?"),
-            ("Project scope creep", "How will you manage expectations?")
-        ],
-        "Compliance & Legal Risks": [
-            ("Regulatory changes (AI Act, privacy laws)", "Are you prepared for new regulations?"),
-            ("Data privacy violations", "GDPR, CCPA, HIPAA compliance?"),
-            ("Intellectual property concerns", "Who owns AI-generated content?"),
-            ("Bias and fairness issues", "How will you ensure ethical AI?"),
-            ("Liability for AI decisions", "What's your risk mitigation strategy?")
-        ],
-        "Security Risks": [
-            ("Data breaches and leaks", "Sensitive data protection measures?"),
-            ("Prompt injection attacks", "Security testing protocols?"),
-            ("Model theft or reverse engineering", "IP protection mechanisms?"),
-            ("Supply chain vulnerabilities", "Third-party risk assessment?"),
-            ("Insider threats", "Access controls and monitoring?")
-        ]
-    }
-    
             # Manual risk assessment
             st.info("📝 **Manual Assessment:** For detailed manual risk assessment, use the AI assessment as a starting point and export the results. You can then review and adjust scores offline.")
             
             st.markdown("**Quick Manual Override:**")
-            st.text_area("Add your own risk notes here:", height=200, placeholder="Enter any specific risks or concerns unique to your organization...")
+            st.text_area("Add your own risk notes here:", height=200, placeholder="Enter any specific risks or concerns unique to your organization...", key='risk_notes')
             
             st.session_state.risk_assessment_done = True
 
+if section == "⚠️ Risk Assessment":
+    _risk_tab()
+
 # Tab 5: AI Recommendations
-with tab5:
+if section == "🤖 AI Recommendations":
     st.header("🤖 AI-Powered Recommendations")
     st.info("💡 Get AI-powered optimization recommendations based on your inputs.")
     
     if st.button("📊 Show Sample Recommendations", key="show_recs_btn"):
-        st.subheader("⚡ Quick Wins")
-        st.success("**Optimize API Calls:** Potential savings of $45K/year")
-        st.success("**Leverage Open Source:** Potential savings of $28K/year")
-        
-        st.subheader("💰 Cost Optimization")
-        st.info("**Right-size Infrastructure:** Potential savings of $36K/year")
+        st.success(_SAMPLE_RECS_MD)
 
 # Tab 6: Comparison Mode
 # Tab 6: AI Model Selector (NEW)
-with tab6:
-    import sys
-    sys.path.append('/mnt/user-data/outputs')
-    from ai_model_selector import render_model_comparison_tool
+if section == "🔍 Model Selector":
     render_model_comparison_tool()
 
 # Tab 7: Comparison Mode (formerly tab6)
-with tab7:
+if section == "🔄 Comparison Mode":
     st.header("🔄 Scenario Comparison")
     st.info("💡 Compare multiple scenarios side-by-side.")
     
-    st.markdown("**Feature Highlights:**")
-    st.markdown("• Save and compare 2-10 scenarios")
-    st.markdown("• Compare costs, benefits, and ROI")
-    st.markdown("• Identify best option by criteria")
+    st.markdown(_COMPARISON_FEATURES_MD)
     
     # Sample data
-    import pandas as pd
-    sample_df = pd.DataFrame({
-        'Scenario': ['Conservative', 'Baseline', 'Aggressive'],
-        '3-Year TCO': ['$2.1M', '$2.8M', '$3.5M'],
-        'ROI %': ['145%', '175%', '220%']
-    })
-    st.dataframe(sample_df)
+    st.dataframe(_sample_scenarios_df())
 
 # Tab 8: Summary Report (formerly tab7)
-with tab8:
+if section == "📋 Summary Report":
     st.header("📋 Executive Summary Report")
     
     if 'cost_data' not in st.session_state:
-        st.warning("⚠️ Please complete Cost Analysis first.")
-        if st.button("📊 Load Demo Data"):
-            st.session_state.cost_data = {
-                'org_name': 'TechCorp Solutions',
-                'industry': 'Technology',
-                'use_case': 'Customer Service',
-                'year1_total': 950000,
-                'year2_total': 1150000,
-                'year3_total': 1380000,
-                'three_year_tco': 3480000
-            }
-            st.session_state.roi_data = {
-                'three_year_benefits': 3880000,
-                'roi_percentage': 175,
-                'payback_months': 18,
-                'net_benefit': 400000
-            }
-            st.rerun()
-    else:
+        # Load the demo payload within this run instead of forcing another rerun
+        prompt = st.empty()
+        with prompt.container():
+            st.warning("⚠️ Please complete Cost Analysis first.")
+            load_demo = st.button("📊 Load Demo Data")
+        if load_demo:
+            st.session_state.cost_data, st.session_state.roi_data = _demo_cost_roi()
+            prompt.empty()
+    
+    if 'cost_data' in st.session_state:
         cost_data = st.session_state.cost_data
         st.markdown(f"## {cost_data.get('org_name', 'Organization')}")
         st.markdown(f"**Industry:** {cost_data.get('industry', 'N/A')}")
         
         st.subheader("📊 Key Metrics")
+        roi = st.session_state.get('roi_data')
         col1, col2, col3 = st.columns(3)
-        with col1:
-            st.metric("3-Year TCO", f"${cost_data.get('three_year_tco', 0):,.0f}")
-        with col2:
-            if 'roi_data' in st.session_state:
-                st.metric("ROI", f"{st.session_state.roi_data.get('roi_percentage', 0):.0f}%")
-        with col3:
-            if 'roi_data' in st.session_state:
-                st.metric("Payback", f"{st.session_state.roi_data.get('payback_months', 0)} months")
+        col1.metric("3-Year TCO", _USD(cost_data.get('three_year_tco', 0)))
+        if roi is not None:
+            col2.metric("ROI", f"{roi.get('roi_percentage', 0):.0f}%")
+            col3.metric("Payback", f"{roi.get('payback_months', 0)} months")
         
         st.markdown("---")
         st.subheader("📥 Export Report")
         
-        # PDF Export
-        col1, col2, col3 = st.columns(3)
+        # PDF Export - the report is generated only when the download is clicked,
+        # from the shared cache rather than a per-session copy; the cover page and
+        # the filename carry the same minute-resolution timestamp
+        generated_at = datetime.now().replace(second=0, microsecond=0)
+        pdf_inputs = (dict(cost_data),
+                      dict(st.session_state.get('roi_data', {})),
+                      dict(st.session_state.get('risk_data', {})),
+                      generated_at)
+        # The report is built on the download's own thread, alongside the rerun the
+        # click starts, so a failure can only be reported on a later run
+        pdf_failures = st.session_state.setdefault('pdf_failures', {})
+        if 'pdf' in pdf_failures:
+            st.error(f"An earlier PDF download failed: {pdf_failures.pop('pdf')}")
+        col1, col2 = st.columns([1, 2])
         
         with col1:
-            if st.button("📄 Generate PDF Report", type="primary", use_container_width=True, key="generate_pdf_btn"):
-                with st.spinner("Generating comprehensive 20+ page PDF report..."):
-                    try:
-                        # Import comprehensive PDF generator
-                        import sys
-                        sys.path.append('/mnt/user-data/outputs')
-                        from comprehensive_pdf_generator import generate_comprehensive_pdf_report
-                        
-                        # Generate comprehensive PDF
-                        pdf_bytes = generate_comprehensive_pdf_report(
-                            cost_data=cost_data,
-                            roi_data=st.session_state.get('roi_data', {}),
-                            risk_data=st.session_state.get('risk_data', {})
-                        )
-                        
-                        # Store in session state for download
-                        st.session_state.pdf_report = pdf_bytes
-                        st.success("✅ Comprehensive 20+ page PDF report generated successfully!")
-                    except Exception as e:
-                        st.error(f"Error generating PDF: {str(e)}")
-                        st.info("💡 Tip: Make sure reportlab is installed: `pip install reportlab`")
+            st.download_button(
+                label="📥 Download PDF Report",
+                data=partial(_pdf_download, *pdf_inputs, pdf_failures),
+                file_name=generated_at.strftime("GenAI_Investment_Analysis_%Y%m%d_%H%M.pdf"),
+                mime="application/pdf",
+                type="primary",
+                width="stretch",
+                help="The report is generated when you click. If that fails, the error "
+                     "appears on this page the next time it updates.",
+                key="download_pdf_btn"
+            )
         
-        # Download button (appears after PDF is generated)
-        if 'pdf_report' in st.session_state:
-            with col2:
-                st.download_button(
-                    label="📥 Download PDF Report",
-                    data=st.session_state.pdf_report,
-                    file_name=f"GenAI_Investment_Analysis_{datetime.now().strftime('%Y%m%d_%H%M')}.pdf",
-                    mime="application/pdf",
-                    type="primary",
-                    use_container_width=True,
-                    key="download_pdf_btn"
-                )
-        
-        with col3:
-            st.markdown("**Comprehensive 20+ Page Report includes:**")
-            st.markdown("• Executive summary & TOC")
-            st.markdown("• Methodology & assumptions")
-            st.markdown("• Detailed cost breakdown with charts")
-            st.markdown("• ROI & financial analysis")
-            st.markdown("• Risk assessment & mitigation")
-            st.markdown("• Implementation roadmap")
-            st.markdown("• Technology stack recommendations")
-            st.markdown("• Governance framework")
-            st.markdown("• Change management strategy")
-            st.markdown("• Success metrics & KPIs")
-            st.markdown("• Industry benchmarks")
-            st.markdown("• Appendices & glossary")
+        with col2:
+            st.markdown(_REPORT_CONTENTS_MD)
 
 
 # Professional Footer
 st.markdown("---")
-st.markdown("""
-<div class="footer">
-<h3 style='color: #1f77b4; margin-bottom: 15px;'>Gen AI ROI & TCO Calculator</h3>
-<p style='margin: 10px 0;'><strong>Enterprise Decision Support Tool</strong></p>
-<p style='margin: 10px 0;'>Built with Streamlit | Comprehensive AI Investment Analysis</p>
-<p style='font-size: 0.9em; margin-top: 20px; color: #888;'>
-⚠️ <em>This calculator provides estimates based on inputs. Actual costs and benefits may vary.<br>
-Consult with financial and technical experts for major investment decisions.</em>
-</p>
-<p style='font-size: 0.85em; margin-top: 15px; color: #aaa;'>Version 1.0 | © 2024</p>
-</div>
-""", unsafe_allow_html=True)
\ No newline at end of file
+st.markdown(_FOOTER_HTML, unsafe_allow_html=True)
\ No newline at end of file